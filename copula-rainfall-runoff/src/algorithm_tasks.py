@@ -0,0 +1,829 @@
+# env imports
+import collections
+import functools
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+
+# local imports
+from helpers.utils import get_copula_families, get_integration_scheme
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - numba is an optional speedup
+    njit = None
+    prange = range
+
+try:
+    import dask
+except ImportError:  # pragma: no cover - dask is an optional scheduler
+    dask = None
+
+
+N_JOBS = os.cpu_count() or 1
+
+# on-disk memo store for whole CDF columns; see `compute_cdf(use_cache=)`
+_memory = joblib.Memory(os.environ.get("COPULA_CDF_CACHE", ".cache_cdf"),
+                        verbose=0)
+
+DEFAULT_RETURN_PERIODS = (2, 5, 10, 25, 50, 100)
+
+# One integration region in the (v, t) plane: outer t on [a, b], inner v
+# between the constant lower bound c_const and the upper curve d(t),
+# which is either the affine d_slope*t + d_intercept or the constant
+# d_const. Plain scalars so quadrature loops never call back into
+# Python per sample.
+Bounds = collections.namedtuple(
+    "Bounds", ["a", "b", "c_const", "d_slope", "d_intercept",
+               "d_is_const", "d_const"])
+
+
+def evaluate_upper_bound(bounds: Bounds, t):
+    """Upper v-curve d(t) of a region, vectorized over t."""
+    t = np.asarray(t, dtype=float)
+    if bounds.d_is_const:
+        return np.full_like(t, bounds.d_const)
+    return bounds.d_slope * t + bounds.d_intercept
+
+
+# params-derived constants shared by every v0 of a sweep; resolved
+# once per parameter set through `_derive_thresholds`
+_RunoffThresholds = collections.namedtuple(
+    "_RunoffThresholds",
+    ["h", "Sdi", "Sd", "storage_gap", "fc", "Sm", "pervious_slope", "t_sat"])
+
+
+@functools.lru_cache(maxsize=None)
+def _derive_thresholds(h: float, Sdi: float, Sil: float, fc: float,
+                       Sm: float) -> _RunoffThresholds:
+    """Constant-fold the physics quantities the depth curve derives.
+
+    `Sd`, the initial-loss gap `Sil - Sdi`, the pervious slope and the
+    saturation time depend only on the parameter set, not on v0, so
+    they are computed once instead of per grid point.
+    """
+    return _RunoffThresholds(h, Sdi, h * Sdi + (1.0 - h) * Sil, Sil - Sdi,
+                             fc, Sm, (1.0 - h) * fc, Sm / fc)
+
+
+def _runoff_depth_curve(v0: float, physical_params: dict):
+    """Rainfall depth v*(t) below which an event produces at most `v0`.
+
+    The event runoff functional is
+    `V0 = h*(v - Sdi)+ + (1-h)*(v - Sil - min(fc*t, Sm))+`
+    (impervious and pervious contributions, infiltration capped by the
+    soil storage). Inverting it in v at fixed duration t gives a
+    piecewise curve: constant `Sdi + v0/h` where only the impervious
+    area contributes, affine `v0 + Sd + (1-h)*fc*t` while infiltration
+    is still filling the soil store, and constant once it saturates.
+
+    Returns `(t_break, slope, intercept, plateau)`: the curve is affine
+    up to `t_break` and constant `plateau` afterwards.
+    """
+    p = _derive_thresholds(physical_params["h"], physical_params["Sdi"],
+                           physical_params["Sil"], physical_params["fc"],
+                           physical_params["Sm"])
+
+    t_star = (v0 / p.h - p.storage_gap) / p.fc  # pervious area stops
+    if t_star <= 0.0:
+        # impervious runoff alone exceeds v0 for any duration
+        return 0.0, 0.0, p.Sdi + v0 / p.h, p.Sdi + v0 / p.h
+    if t_star <= p.t_sat:
+        return t_star, p.pervious_slope, v0 + p.Sd, p.Sdi + v0 / p.h
+    return (p.t_sat, p.pervious_slope, v0 + p.Sd,
+            v0 + p.Sd + (1.0 - p.h) * p.Sm)
+
+
+def _cdf_kernel_python(v0, h, Sdi, Sil, fc, Sm, lambda_v, lambda_t):
+    """One fused pass over v0 with per-element regime branching."""
+    Sd = h * Sdi + (1.0 - h) * Sil
+    k = lambda_t + lambda_v * (1.0 - h) * fc
+    C_param = lambda_t / k
+    t_sat = Sm / fc
+
+    cdf = np.empty(v0.size)
+    for i in prange(v0.size):
+        value = v0[i]
+        t_star = (value / h - (Sil - Sdi)) / fc
+        if t_star <= 0.0:
+            cdf[i] = 1.0 - np.exp(-lambda_v * (Sdi + value / h))
+            continue
+        if t_star <= t_sat:
+            t_break = t_star
+            plateau = Sdi + value / h
+        else:
+            t_break = t_sat
+            plateau = value + Sd + (1.0 - h) * Sm
+        # affine part of v*(t) on [0, t_break], constant plateau beyond
+        affine = C_param * np.exp(-lambda_v * (value + Sd)) * (
+            1.0 - np.exp(-k * t_break))
+        constant = np.exp(-lambda_t * t_break) * np.exp(-lambda_v * plateau)
+        cdf[i] = 1.0 - affine - constant
+    return cdf
+
+
+if njit is not None:
+    _cdf_kernel = njit(parallel=True, fastmath=True, cache=True)(
+        _cdf_kernel_python)
+else:
+    _cdf_kernel = _cdf_kernel_python
+
+
+def runoff_volume_cdf_closed_form(v0_vals, physical_params: dict) -> np.ndarray:
+    """Closed-form CDF of the event runoff volume.
+
+    Analytical probabilistic model in the spirit of Guo & Adams (1998):
+    independent exponential event rainfall volume (rate `lambda_v`) and
+    duration (rate `lambda_t`). Conditioning on the duration and
+    integrating `F_V(v*(t))` analytically over the exponential duration
+    density gives, with `v*` the piecewise curve of
+    `_runoff_depth_curve`, a continuous three-regime expression.
+
+    Evaluated by a Numba-compiled parallel kernel when numba is
+    installed; a plain Python loop otherwise.
+    """
+    v0 = np.ascontiguousarray(v0_vals, dtype=np.float64)
+    return _cdf_kernel(v0, physical_params["h"], physical_params["Sdi"],
+                       physical_params["Sil"], physical_params["fc"],
+                       physical_params["Sm"], physical_params["lambda_v"],
+                       physical_params["lambda_t"])
+
+
+def get_runoff_integration_bounds(v0: float, physical_params: dict,
+                                  v0_limit: float = None) -> list:
+    """Integration region(s) of P(V0 <= v0) in the (v, t) plane.
+
+    The region below the `_runoff_depth_curve` is split at the curve's
+    break point into `Bounds` records: the upper v-curve is affine while
+    the soil store fills and constant afterwards. A finite `v0_limit`
+    splits the affine piece again where it reaches the cap, so every
+    region stays purely affine or constant. Durations are truncated at
+    `t_max` (default ten mean durations).
+
+    Memoized on (v0, params, v0_limit): the sensitivity and bootstrap
+    sweeps re-enter compute_cdf many times with the physics unchanged,
+    and the regions only depend on the physics. Returns a fresh list
+    each call; the `Bounds` records themselves are immutable.
+    """
+    cached = _cached_integration_bounds(
+        float(v0), tuple(sorted(physical_params.items())), v0_limit)
+    return list(cached)
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_integration_bounds(v0: float, params_items: tuple,
+                               v0_limit) -> tuple:
+    physical_params = dict(params_items)
+    lambda_t = physical_params["lambda_t"]
+    t_max = physical_params.get("t_max", 10.0 / lambda_t)
+    t_break, slope, intercept, plateau = _runoff_depth_curve(v0, physical_params)
+
+    cap = v0_limit if v0_limit is not None else np.inf
+    plateau = min(plateau, cap)
+
+    regions = []
+    if t_break > 0.0:
+        b = min(t_break, t_max)
+        t_cap = (cap - intercept) / slope if slope > 0.0 else np.inf
+        if t_cap < b:
+            # affine piece reaches the cap before the break point
+            regions.append(Bounds(0.0, t_cap, 0.0, slope, intercept,
+                                  False, np.nan))
+            regions.append(Bounds(t_cap, b, 0.0, 0.0, 0.0, True, cap))
+        else:
+            regions.append(Bounds(0.0, b, 0.0, slope, intercept,
+                                  False, np.nan))
+    if t_break < t_max:
+        regions.append(Bounds(t_break, t_max, 0.0, 0.0, 0.0, True, plateau))
+    return tuple(regions)
+
+
+def _clayton_pdf_python(u, v, theta):
+    return ((1.0 + theta) * (u * v) ** (-1.0 - theta)
+            * (u ** -theta + v ** -theta - 1.0) ** (-2.0 - 1.0 / theta))
+
+
+def _frank_pdf_python(u, v, theta):
+    g = 1.0 - np.exp(-theta)
+    numerator = theta * g * np.exp(-theta * (u + v))
+    denominator = (g - (1.0 - np.exp(-theta * u))
+                   * (1.0 - np.exp(-theta * v))) ** 2
+    return numerator / denominator
+
+
+def _gumbel_pdf_python(u, v, theta):
+    x = -np.log(u)
+    y = -np.log(v)
+    s = x ** theta + y ** theta
+    big_a = s ** (1.0 / theta)
+    return (np.exp(-big_a) / (u * v) * (x * y) ** (theta - 1.0)
+            * s ** (1.0 / theta - 2.0) * (big_a + theta - 1.0))
+
+
+if njit is not None:
+    _clayton_pdf = njit(cache=True, fastmath=True)(_clayton_pdf_python)
+    _frank_pdf = njit(cache=True, fastmath=True)(_frank_pdf_python)
+    _gumbel_pdf = njit(cache=True, fastmath=True)(_gumbel_pdf_python)
+else:
+    _clayton_pdf = _clayton_pdf_python
+    _frank_pdf = _frank_pdf_python
+    _gumbel_pdf = _gumbel_pdf_python
+
+_COPULA_PDF_KERNELS = {
+    "clayton": _clayton_pdf,
+    "frank": _frank_pdf,
+    "gumbel": _gumbel_pdf,
+}
+
+
+def _copula_pdf_function(copula_instance):
+    """Vectorized `pdf(u, v)` of a copula, native where the family is known.
+
+    The three fitted families have closed-form densities, so their
+    evaluation runs as a Numba kernel (plain NumPy without numba)
+    instead of going through the statsmodels dispatch; unrecognized
+    copula instances fall back to their own `.pdf`.
+    """
+    name = type(copula_instance).__name__.replace("Copula", "").lower()
+    kernel = _COPULA_PDF_KERNELS.get(name)
+    if kernel is None:
+        def pdf(u, v):
+            return copula_instance.pdf(np.column_stack((u, v)))
+        return pdf
+    theta = float(np.squeeze(copula_instance.theta))
+
+    def pdf(u, v):
+        return kernel(u, v, theta)
+    return pdf
+
+
+def get_copula_joint_density_function(copula_instance, physical_params: dict,
+                                      dtype=np.float64):
+    """Joint density f(v, t) implied by a copula and exponential marginals.
+
+    `dtype=np.float32` halves the bandwidth of the marginal and stacking
+    work, which is plenty for the ~1% accuracy return periods need.
+    """
+    lambda_v = dtype(physical_params["lambda_v"])
+    lambda_t = dtype(physical_params["lambda_t"])
+    copula_pdf = _copula_pdf_function(copula_instance)
+
+    def joint_density(v, t):
+        # closed-form exponential marginals: one exp per variable
+        # serves both the CDF (1 - exp) and the PDF (lambda * exp),
+        # skipping the scipy frozen-distribution dispatch
+        ev = np.exp(-lambda_v * np.asarray(v, dtype=dtype))
+        et = np.exp(-lambda_t * np.asarray(t, dtype=dtype))
+        pdf = copula_pdf(1.0 - ev, 1.0 - et).astype(dtype, copy=False)
+        return pdf * (lambda_v * ev) * (lambda_t * et)
+
+    return joint_density
+
+
+def _fast_ranks(x: np.ndarray) -> np.ndarray:
+    """1-based ranks of a sample without tie handling.
+
+    Equivalent to `stats.rankdata(x, method='average')` when the values
+    are unique, which holds for continuous rainfall depths and
+    durations, at the cost of one argsort instead of rankdata's
+    tie-resolution passes. Runs 2 * n_bootstrap times on the bootstrap
+    hot path.
+    """
+    order = x.argsort(kind="quicksort")
+    ranks = np.empty(x.size, dtype=np.float64)
+    ranks[order] = np.arange(1, x.size + 1, dtype=np.float64)
+    return ranks
+
+
+# per-family coefficient formulas: one hash probe on lookup instead of
+# a string-comparison chain; frank and gaussian have no tail dependence
+# for any parameter value
+_TAIL_DEPENDENCE_DISPATCH = {
+    "clayton": lambda theta: (2.0 ** (-1.0 / theta) if theta > 0 else 0.0,
+                              0.0),
+    "gumbel": lambda theta: (0.0, 2.0 - 2.0 ** (1.0 / theta)),
+    "frank": lambda theta: (0.0, 0.0),
+    "gaussian": lambda theta: (0.0, 0.0),
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _tail_dependence_coefficients(family: str, theta: float):
+    """Cached (lambda_lower, lambda_upper) for one (family, theta) pair."""
+    try:
+        formula = _TAIL_DEPENDENCE_DISPATCH[family]
+    except KeyError:
+        raise ValueError(f"unknown copula family: {family}") from None
+    return formula(theta)
+
+
+def _compute_tail_dependence(family: str, theta) -> tuple:
+    """Tail-dependence coefficients of a fitted copula, memoized.
+
+    The same few (family, theta) pairs are queried once per v0 point on
+    the CDF grid and once per bootstrap replicate; after the first call
+    each lookup is a dict probe instead of repeated pow/exp evaluation.
+    Theta is rounded to 12 decimals so float noise from refits of the
+    same sample still hits the cache.
+    """
+    return _tail_dependence_coefficients(family, round(float(theta), 12))
+
+
+def fit_copulas(events_df: pd.DataFrame, volume_col: str = "depth",
+                duration_col: str = "duration", copula_families=None):
+    """Fit each copula family to the rank-transformed event sample.
+
+    Returns `(fitted, metrics_df)` where `fitted` maps family name to the
+    fitted copula instance and `metrics_df` carries theta, log-likelihood,
+    AIC (one estimated parameter each) and the tail-dependence
+    coefficients per family.
+    """
+    volume = events_df[volume_col].to_numpy()
+    duration = events_df[duration_col].to_numpy()
+    n = len(volume)
+
+    # fill the pseudo-observations into one preallocated C-contiguous
+    # block; dividing in place skips the intermediate rank copies
+    uv = np.empty((n, 2))
+    uv[:, 0] = _fast_ranks(volume)
+    uv[:, 0] /= n + 1
+    uv[:, 1] = _fast_ranks(duration)
+    uv[:, 1] /= n + 1
+
+    # one typed column array per metric instead of a list of row dicts,
+    # so pandas gets final dtypes without per-row inference
+    families = get_copula_families(copula_families)
+    names = list(families)
+    thetas = np.empty(len(names))
+    log_likelihoods = np.empty(len(names))
+    lambda_lower = np.empty(len(names))
+    lambda_upper = np.empty(len(names))
+
+    fitted = {}
+    for index, name in enumerate(names):
+        family = families[name]
+        theta = family().fit_corr_param(uv)
+        copula = family(theta)
+        fitted[name] = copula
+        thetas[index] = theta
+        log_likelihoods[index] = np.log(copula.pdf(uv)).sum()
+        lambda_lower[index], lambda_upper[index] = _compute_tail_dependence(
+            name, theta)
+
+    metrics_df = pd.DataFrame({
+        "Family": names,
+        "theta": thetas,
+        "log_likelihood": log_likelihoods,
+        "AIC": 2.0 - 2.0 * log_likelihoods,
+        "lambda_lower": lambda_lower,
+        "lambda_upper": lambda_upper,
+    })
+    return fitted, metrics_df
+
+
+def _pack_bounds(bounds_per_v0):
+    """Flatten per-v0 region lists into packed scalar arrays.
+
+    Constant upper curves are encoded as slope 0 / intercept d_const so
+    kernels need no branching. Returns `(owner, a, b, c, d_slope,
+    d_intercept)` with `owner` mapping each region to its v0 index.
+    """
+    regions = [bounds for bounds_list in bounds_per_v0
+               for bounds in bounds_list]
+    owner = np.repeat(np.arange(len(bounds_per_v0)),
+                      [len(bounds_list) for bounds_list in bounds_per_v0])
+    a = np.array([r.a for r in regions])
+    b = np.array([r.b for r in regions])
+    c = np.array([r.c_const for r in regions])
+    d_slope = np.array([0.0 if r.d_is_const else r.d_slope for r in regions])
+    d_intercept = np.array([r.d_const if r.d_is_const else r.d_intercept
+                            for r in regions])
+    return owner, a, b, c, d_slope, d_intercept
+
+
+def _integrate_all_python(a, b, half_span, pdf_grid, f_v, f_t, weights):
+    """Gauss-Legendre reduction over every packed region at once."""
+    order = weights.size
+    out = np.empty(a.size)
+    for r in prange(a.size):
+        acc = 0.0
+        for i in range(order):
+            row = 0.0
+            for j in range(order):
+                row += weights[j] * pdf_grid[r, i, j] * f_v[r, i, j]
+            acc += weights[i] * half_span[r, i] * f_t[r, i] * row
+        out[r] = 0.5 * (b[r] - a[r]) * acc
+    return out
+
+
+if njit is not None:
+    _integrate_all = njit(parallel=True, fastmath=True, cache=True)(
+        _integrate_all_python)
+else:
+    _integrate_all = _integrate_all_python
+
+
+def _tensor_gauss_cdf_all(copula_instances, bounds_per_v0,
+                          physical_params: dict,
+                          quad_order: int = 32) -> list:
+    """Tensor-Gauss CDF columns of every copula off one shared grid.
+
+    The region geometry, sample grids and exponential marginals are
+    copula-independent, so they are built once and every copula only
+    pays for tabulating its own pdf kernel plus the `_integrate_all`
+    reduction. The reduction parallelizes over the region axis
+    (`prange` inside `_integrate_all`) - regions outnumber copula
+    families by orders of magnitude, so a second parallel loop over
+    copulas would only nest thread pools.
+    """
+    lambda_v = physical_params["lambda_v"]
+    lambda_t = physical_params["lambda_t"]
+    owner, a, b, c, d_slope, d_intercept = _pack_bounds(bounds_per_v0)
+    nodes, weights = np.polynomial.legendre.leggauss(quad_order)
+
+    t = (0.5 * (b - a)[:, None] * nodes[None, :]
+         + 0.5 * (b + a)[:, None])                       # (R, order)
+    d = d_slope[:, None] * t + d_intercept[:, None]
+    half_span = 0.5 * (d - c[:, None])
+    v = (half_span[:, :, None] * nodes[None, None, :]
+         + 0.5 * (d + c[:, None])[:, :, None])           # (R, order, order)
+
+    ev = np.exp(-lambda_v * v)
+    et = np.exp(-lambda_t * t)
+    u_v = (1.0 - ev).ravel()
+    u_t = np.broadcast_to((1.0 - et)[:, :, None], v.shape).ravel()
+    f_v = lambda_v * ev
+    f_t = lambda_t * et
+
+    columns = []
+    for copula_instance in copula_instances:
+        copula_pdf = _copula_pdf_function(copula_instance)
+        pdf_grid = copula_pdf(u_v, u_t).reshape(v.shape)
+        out = _integrate_all(a, b, half_span, pdf_grid, f_v, f_t, weights)
+        columns.append(np.bincount(owner, weights=out,
+                                   minlength=len(bounds_per_v0)))
+    return columns
+
+
+def _tensor_gauss_cdf(copula_instance, bounds_per_v0, physical_params: dict,
+                      quad_order: int = 32) -> np.ndarray:
+    """Single-copula convenience wrapper around `_tensor_gauss_cdf_all`."""
+    return _tensor_gauss_cdf_all([copula_instance], bounds_per_v0,
+                                 physical_params, quad_order)[0]
+
+
+def _monte_carlo_cdf(density, bounds_per_v0, n_samples: int = 10_000,
+                     random_state=None) -> np.ndarray:
+    """All v0 Monte Carlo integrals from one copula-pdf call.
+
+    Flattens every region of every v0 into one sample tensor: region
+    geometry (t-interval, upper curve) is broadcast from packed scalar
+    arrays, the joint density is evaluated once on the flat sample and
+    per-region estimates are summed back onto their v0 with bincount.
+    This amortizes the statsmodels pdf dispatch over all
+    `n_regions * n_samples` points instead of paying it per region.
+    """
+    owner, a, b, c, d_slope, d_intercept = _pack_bounds(bounds_per_v0)
+
+    rng = np.random.default_rng(random_state)
+    t = a[:, None] + (b - a)[:, None] * rng.uniform(size=(a.size, n_samples))
+    d = d_slope[:, None] * t + d_intercept[:, None]
+    v = c[:, None] + (d - c[:, None]) * rng.uniform(size=t.shape)
+
+    values = density(v.ravel(), t.ravel()).reshape(t.shape)
+    estimates = (b - a) * ((d - c[:, None]) * values).mean(axis=1)
+    return np.bincount(owner, weights=estimates, minlength=len(bounds_per_v0))
+
+
+def _copula_worker(density, bounds_per_v0, scheme) -> np.ndarray:
+    """Whole-grid CDF column of one copula, swept inside a single task.
+
+    The scheme closures evaluate the density on full sample arrays, so
+    sweeping every v0 here costs the same integration work as per-point
+    tasks did - minus one density pickle and one dispatch per v0.
+    """
+    return np.array([sum(scheme(density, bounds) for bounds in bounds_list)
+                     for bounds_list in bounds_per_v0])
+
+
+def _shared_grid_cdf(density, v0_vals, physical_params: dict,
+                     v0_limit: float = None, grid_size: int = 256) -> np.ndarray:
+    """All v0 integrals from one shared density grid.
+
+    The joint density is v0-independent - only the integration limits
+    move - so it is tabulated once on a dense (v, t) grid and each v0
+    slice is integrated by interpolating the cumulative inner integral
+    at its upper curve d(t) and applying Simpson along t. This hoists
+    the O(n_v0 * n_quad^2) copula-pdf work down to one grid evaluation
+    per copula.
+    """
+    from scipy.integrate import cumulative_trapezoid, simpson
+
+    lambda_t = physical_params["lambda_t"]
+    t_max = physical_params.get("t_max", 10.0 / lambda_t)
+    curves = [_runoff_depth_curve(v0, physical_params) for v0 in v0_vals]
+    cap = v0_limit if v0_limit is not None else np.inf
+    v_max = min(max(max(p, i + s * min(tb, t_max)) for tb, s, i, p in curves),
+                cap)
+
+    t = np.linspace(0.0, t_max, grid_size)
+    v = np.linspace(0.0, v_max, grid_size)
+    joint = density(np.repeat(v, grid_size), np.tile(t, grid_size))
+    joint = joint.reshape(grid_size, grid_size)  # (v, t)
+    inner_cum = cumulative_trapezoid(joint, v, axis=0, initial=0.0)
+
+    columns = np.arange(grid_size)
+    cdf = np.empty(len(curves))
+    for index, (t_break, slope, intercept, plateau) in enumerate(curves):
+        d = np.where(t <= t_break, intercept + slope * t, min(plateau, cap))
+        d = np.clip(d, v[0], v[-1])
+        hi = np.clip(np.searchsorted(v, d), 1, grid_size - 1)
+        weight = (d - v[hi - 1]) / (v[hi] - v[hi - 1])
+        inner = (inner_cum[hi - 1, columns] * (1.0 - weight)
+                 + inner_cum[hi, columns] * weight)
+        cdf[index] = simpson(inner, x=t)
+    return cdf
+
+
+def _assemble_cdf_frame(v0_vals, names, columns, dtype) -> pd.DataFrame:
+    """CDF frame from one preallocated (n_v0, 1 + n_copulas) block.
+
+    Clipping writes straight into the block and the DataFrame is built
+    exactly once, so pandas holds a single consolidated array instead
+    of copy-consolidating one array per column.
+    """
+    out = np.empty((len(v0_vals), 1 + len(names)), dtype=dtype)
+    out[:, 0] = v0_vals
+    for index, values in enumerate(columns):
+        np.clip(values, 0.0, 1.0, out=out[:, 1 + index])
+    return pd.DataFrame(out, columns=["v0", *names])
+
+
+@_memory.cache
+def _compute_cdf_column(family: str, theta: float, params_items: tuple,
+                        v0_tuple: tuple, method: str, v0_limit,
+                        dtype_name: str, kwargs_items: tuple) -> np.ndarray:
+    """One copula's CDF column, memoized on disk.
+
+    Keyed on plain hashable values only - the copula is rebuilt from
+    (family, theta) - so re-runs of the pipeline with unchanged inputs
+    read the column back instead of integrating again.
+    """
+    copula = get_copula_families([family])[family](theta)
+    frame = compute_cdf({family: copula}, np.array(v0_tuple),
+                        dict(params_items), integration_method=method,
+                        v0_limit=v0_limit, n_jobs=1,
+                        dtype=np.dtype(dtype_name).type,
+                        **dict(kwargs_items))
+    return frame[family].to_numpy()
+
+
+def compute_cdf(copulas: dict, v0_vals, physical_params: dict,
+                integration_method: str = "TENSOR_GAUSS",
+                v0_limit: float = None, n_jobs: int = None,
+                v0_bounds_list: list = None, dtype=np.float64,
+                use_cache: bool = False, **scheme_kwargs) -> pd.DataFrame:
+    """Runoff-volume CDF of each fitted copula on the `v0_vals` grid.
+
+    P(V0 <= v0) is the integral of the copula joint density over the
+    region(s) returned by `get_runoff_integration_bounds`. Workers are
+    dispatched per copula and sweep the full v0 grid internally, except
+    for ``SHARED_GRID`` which tabulates the (v0-independent) density
+    once per copula and integrates every v0 slice off that grid.
+
+    Callers that sweep many copulas over fixed physics (bootstrap,
+    sensitivity) can precompute the regions once and pass them as
+    `v0_bounds_list` (one region list per v0) to skip rebuilding them.
+    `dtype=np.float32` runs the marginal evaluation and stores the
+    whole result frame at half the memory bandwidth. `use_cache=True`
+    memoizes each copula column on disk (`.cache_cdf/`, overridable
+    via the COPULA_CDF_CACHE environment variable), so repeated
+    pipeline runs with unchanged inputs skip the integration entirely;
+    `compute_cdf.clear_cache()` drops the store.
+    """
+    v0_vals = np.asarray(v0_vals, dtype=float)
+    n_jobs = n_jobs or N_JOBS
+
+    if use_cache:
+        # deterministic in its inputs: key each column on plain values
+        # and let joblib.Memory persist it across processes and runs
+        params_items = tuple(sorted(physical_params.items()))
+        kwargs_items = tuple(sorted(scheme_kwargs.items()))
+        columns = [
+            _compute_cdf_column(name, float(np.squeeze(copula.theta)),
+                                params_items, tuple(v0_vals),
+                                integration_method, v0_limit,
+                                np.dtype(dtype).name, kwargs_items)
+            for name, copula in copulas.items()]
+        return _assemble_cdf_frame(v0_vals, list(copulas), columns, dtype)
+
+    if integration_method == "SHARED_GRID":
+        columns = []
+        for copula in copulas.values():
+            density = get_copula_joint_density_function(copula, physical_params,
+                                                        dtype)
+            columns.append(_shared_grid_cdf(density, v0_vals, physical_params,
+                                            v0_limit, **scheme_kwargs))
+        return _assemble_cdf_frame(v0_vals, list(copulas), columns, dtype)
+
+    if v0_bounds_list is not None:
+        bounds_per_v0 = v0_bounds_list
+    else:
+        # local binding: one global-name lookup for the whole sweep
+        # instead of one per v0
+        bounds_fn = get_runoff_integration_bounds
+        bounds_per_v0 = [bounds_fn(v0, physical_params, v0_limit)
+                         for v0 in v0_vals]
+
+    if integration_method == "MONTE_CARLO":
+        # batched across all v0 regions: one pdf call per copula, each
+        # copula on its own spawned (independent, reproducible) stream
+        seed_seq = np.random.SeedSequence(scheme_kwargs.pop("random_state",
+                                                            None))
+        streams = seed_seq.spawn(len(copulas))
+        columns = []
+        for copula, stream in zip(copulas.values(), streams):
+            density = get_copula_joint_density_function(copula, physical_params,
+                                                        dtype)
+            columns.append(_monte_carlo_cdf(density, bounds_per_v0,
+                                            random_state=stream,
+                                            **scheme_kwargs))
+        return _assemble_cdf_frame(v0_vals, list(copulas), columns, dtype)
+
+    if integration_method == "TENSOR_GAUSS":
+        # packed-bounds kernel: shared sample grid, one pdf tabulation
+        # per copula, Numba reduction over all regions
+        columns = _tensor_gauss_cdf_all(list(copulas.values()), bounds_per_v0,
+                                        physical_params, **scheme_kwargs)
+        return _assemble_cdf_frame(v0_vals, list(copulas), columns, dtype)
+
+    scheme = get_integration_scheme(integration_method, **scheme_kwargs)
+
+    # parallelism only across copulas: each task sweeps the whole v0
+    # grid over the shared precomputed bound lists, so the density is
+    # pickled once per copula instead of once per (copula, v0) pair
+    names = list(copulas)
+    densities = [get_copula_joint_density_function(copulas[name],
+                                                   physical_params, dtype)
+                 for name in names]
+    n_jobs = min(n_jobs, len(names))
+
+    if n_jobs == 1 or len(names) == 1:
+        columns = [_copula_worker(density, bounds_per_v0, scheme)
+                   for density in densities]
+    elif dask is not None:
+        graph = [dask.delayed(_copula_worker)(density, bounds_per_v0, scheme)
+                 for density in densities]
+        columns = dask.compute(*graph, scheduler="processes",
+                               num_workers=n_jobs)
+    else:
+        columns = joblib.Parallel(n_jobs=n_jobs)(
+            joblib.delayed(_copula_worker)(density, bounds_per_v0, scheme)
+            for density in densities)
+
+    return _assemble_cdf_frame(v0_vals, names, columns, dtype)
+
+
+compute_cdf.clear_cache = functools.partial(_compute_cdf_column.clear,
+                                            warn=False)
+
+
+def compute_return_period(cdf_df: pd.DataFrame, events_per_year: float,
+                          return_periods=DEFAULT_RETURN_PERIODS) -> pd.DataFrame:
+    """Runoff volume of each return period, per copula column.
+
+    Inverts F(v0) at the non-exceedance level `1 - 1/(theta*T)` with
+    `theta` the mean number of events per year, by linear interpolation
+    on the monotone CDF curves. All columns are inverted in one batched
+    pass (a broadcast bracket search plus one gather), which matters for
+    sensitivity sweeps where the frame carries one column per swept
+    parameter.
+    """
+    return_periods = np.asarray(return_periods, dtype=float)
+    target_cdf = 1.0 - 1.0 / (events_per_year * return_periods)
+    v0_vals = cdf_df["v0"].to_numpy()
+
+    columns = [column for column in cdf_df.columns if column != "v0"]
+    cdf_matrix = cdf_df[columns].to_numpy()  # (n_v0, K)
+
+    # bracketing index of each target level in every column at once
+    hi = (cdf_matrix[None, :, :] < target_cdf[:, None, None]).sum(axis=1)
+    hi = np.clip(hi, 1, len(v0_vals) - 1)
+    col_index = np.arange(len(columns))[None, :]
+    c_lo = cdf_matrix[hi - 1, col_index]
+    c_hi = cdf_matrix[hi, col_index]
+    span = np.where(c_hi > c_lo, c_hi - c_lo, np.inf)
+    weight = np.clip((target_cdf[:, None] - c_lo) / span, 0.0, 1.0)
+    inverted = v0_vals[hi - 1] + weight * (v0_vals[hi] - v0_vals[hi - 1])
+
+    result = {"return_period": return_periods}
+    for index, column in enumerate(columns):
+        result[column] = inverted[:, index]
+    return pd.DataFrame(result)
+
+
+def perform_bootstrap_uncertainty_analysis(
+        events_df: pd.DataFrame, physical_params: dict, v0_vals,
+        n_bootstrap: int = 100, copula_families=None,
+        volume_col: str = "depth", duration_col: str = "duration",
+        integration_method: str = "TENSOR_GAUSS", random_state: int = 0,
+        confidence: float = 0.95, **scheme_kwargs):
+    """Bootstrap the copula fit and the derived runoff CDF.
+
+    Resamples the event table with replacement `n_bootstrap` times,
+    refits the copulas, recomputes the CDF with the best (lowest-AIC)
+    family and summarizes the curves into a confidence band.
+
+    Returns `(bootstrap_df, band_df)`: per-iteration fitted parameters,
+    and the `(v0, mean, lower, upper)` band consumed by
+    `plotting.plot_bootstrap_confidence_intervals`.
+    """
+    v0_vals = np.asarray(v0_vals, dtype=float)
+    rng = np.random.default_rng(random_state)
+    seeds = rng.integers(2**32, size=n_bootstrap)
+
+    # the physics (and hence the regions) do not change across
+    # resamples, so build them once for all iterations
+    v0_bounds_list = [get_runoff_integration_bounds(v0, physical_params)
+                      for v0 in v0_vals]
+
+    def _one_bootstrap(seed):
+        sample = events_df.sample(frac=1.0, replace=True, random_state=seed)
+        fitted, metrics = fit_copulas(sample, volume_col, duration_col,
+                                      copula_families)
+        best = metrics.loc[metrics["AIC"].idxmin(), "Family"]
+        cdf_df = compute_cdf({best: fitted[best]}, v0_vals, physical_params,
+                             integration_method, n_jobs=1,
+                             v0_bounds_list=v0_bounds_list, **scheme_kwargs)
+        return metrics, best, cdf_df[best].to_numpy()
+
+    def _bootstrap_chunk(chunk_seeds):
+        return [_one_bootstrap(seed) for seed in chunk_seeds]
+
+    # parallelism lives out here: iterations are grouped into ~4 chunks
+    # per worker so scheduler and serialization overhead is paid per
+    # chunk, not per resample (compute_cdf stays serial inside so the
+    # workers don't oversubscribe)
+    chunks = np.array_split(seeds, min(n_bootstrap, 4 * N_JOBS))
+    if dask is not None:
+        graph = [dask.delayed(_bootstrap_chunk)(chunk) for chunk in chunks]
+        chunk_results = dask.compute(*graph, scheduler="threads",
+                                     num_workers=N_JOBS)
+    else:
+        chunk_results = joblib.Parallel(n_jobs=N_JOBS, backend="loky",
+                                        batch_size="auto")(
+            joblib.delayed(_bootstrap_chunk)(chunk) for chunk in chunks)
+    iterations = [result for chunk in chunk_results for result in chunk]
+
+    # columnar assembly: one preallocated array per column, filled by
+    # iteration index, instead of appending a row dict per (i, family)
+    family_names = list(get_copula_families(copula_families))
+    n_families = len(family_names)
+    thetas = np.empty((n_bootstrap, n_families))
+    aics = np.empty((n_bootstrap, n_families))
+    best_flags = np.zeros((n_bootstrap, n_families), dtype=bool)
+    curves = np.empty((n_bootstrap, len(v0_vals)))
+    for i, (metrics, best, curve) in enumerate(iterations):
+        thetas[i] = metrics["theta"].to_numpy()
+        aics[i] = metrics["AIC"].to_numpy()
+        best_flags[i] = metrics["Family"].to_numpy() == best
+        curves[i] = curve
+
+    bootstrap_df = pd.DataFrame({
+        "iteration": np.repeat(np.arange(n_bootstrap), n_families),
+        "Family": np.tile(family_names, n_bootstrap),
+        "theta": thetas.ravel(),
+        "AIC": aics.ravel(),
+        "best": best_flags.ravel(),
+    })
+
+    alpha = (1.0 - confidence) / 2.0
+    band_df = pd.DataFrame({
+        "v0": v0_vals,
+        "mean": curves.mean(axis=0),
+        "lower": np.quantile(curves, alpha, axis=0),
+        "upper": np.quantile(curves, 1.0 - alpha, axis=0),
+    })
+    return bootstrap_df, band_df
+
+
+def perform_sensitivity_analysis(copula_family: str, param_values, v0_vals,
+                                 physical_params: dict,
+                                 integration_method: str = "TENSOR_GAUSS",
+                                 n_jobs: int = None,
+                                 **scheme_kwargs) -> pd.DataFrame:
+    """Runoff CDF for a sweep of the copula dependence parameter.
+
+    Returns a frame with `v0` and one `param_<value>` column per swept
+    theta, consumed by `plotting.plot_parameter_sensitivity`.
+    """
+    family = get_copula_families([copula_family])[copula_family]
+    copulas = {f"param_{value}": family(value) for value in param_values}
+    v0_bounds_list = [get_runoff_integration_bounds(v0, physical_params)
+                      for v0 in np.asarray(v0_vals, dtype=float)]
+    cdf_df = compute_cdf(copulas, v0_vals, physical_params,
+                         integration_method, n_jobs=n_jobs,
+                         v0_bounds_list=v0_bounds_list, **scheme_kwargs)
+    return cdf_df
@@ -0,0 +1,151 @@
+# env imports
+import functools
+
+import numpy as np
+import pandas as pd
+
+
+def to_fortran(df: pd.DataFrame, columns=None) -> pd.DataFrame:
+    """Rebuild a numeric frame on a column-major (Fortran-order) array.
+
+    Code that walks the frame one column at a time (the plotting loops,
+    per-copula reductions) reads one contiguous stream per column after
+    the conversion instead of striding across rows. Frames whose block is
+    already column-contiguous are returned unchanged.
+    """
+    if columns is None:
+        columns = list(df.columns)
+    values = df[list(columns)].to_numpy()
+    if values.flags["F_CONTIGUOUS"]:
+        return df
+    return pd.DataFrame(np.asfortranarray(values), columns=list(columns),
+                        index=df.index)
+
+
+@functools.lru_cache(maxsize=None)
+def _copula_family_map(names: tuple) -> dict:
+    from statsmodels.distributions.copula.api import (
+        ClaytonCopula, FrankCopula, GumbelCopula)
+
+    available = {
+        "clayton": ClaytonCopula,
+        "frank": FrankCopula,
+        "gumbel": GumbelCopula,
+    }
+    return {name: available[name] for name in names}
+
+
+def get_copula_families(copula_families=None) -> dict:
+    """Map family names to their statsmodels copula constructors.
+
+    Each constructor takes the dependence parameter theta. Restrict the
+    returned dict by passing an iterable of names. The map is memoized
+    per name set - the bootstrap asks for it every iteration - and
+    returned as a fresh dict so callers may mutate their copy.
+    """
+    if copula_families is None:
+        copula_families = ("clayton", "frank", "gumbel")
+    return dict(_copula_family_map(tuple(copula_families)))
+
+
+def get_integration_scheme(method: str, **kwargs):
+    """Return `integrate(density, bounds) -> float` for one (v, t) region.
+
+    Schemes are memoized per (method, kwargs) so repeated calls - one
+    per compute_cdf invocation on the bootstrap path - reuse the same
+    closure, including precomputed Gauss-Legendre nodes.
+
+    `bounds` is a `Bounds` record from
+    `algorithm_tasks.get_runoff_integration_bounds`: outer variable t on
+    [a, b], inner variable v between the constant `c_const` and the
+    affine-or-constant upper curve. The schemes read the scalars
+    directly, so no Python callable runs per quadrature sample.
+
+    Supported methods:
+
+    - ``ADAPTIVE_2D_QUADRATURE`` - scipy dblquad, adaptive but calls the
+      density one scalar pair at a time.
+    - ``MONTE_CARLO`` - uniform sampling of the region
+      (kwargs: n_samples, random_state).
+    - ``TENSOR_GAUSS`` - fixed-order tensor-product Gauss-Legendre grid;
+      evaluates the density on one stacked array per region, which
+      amortizes the copula-pdf Python dispatch over the whole grid
+      (kwargs: quad_order).
+    """
+    try:
+        return _build_integration_scheme(method, tuple(sorted(kwargs.items())))
+    except TypeError:  # unhashable kwarg (e.g. a SeedSequence)
+        return _build_integration_scheme.__wrapped__(
+            method, tuple(sorted(kwargs.items())))
+
+
+@functools.lru_cache(maxsize=None)
+def _build_integration_scheme(method: str, kwargs_items: tuple):
+    import scipy.integrate as integrate
+
+    kwargs = dict(kwargs_items)
+
+    if method == "ADAPTIVE_2D_QUADRATURE":
+        order = kwargs.get("quad_order", 32)
+        nodes, weights = np.polynomial.legendre.leggauss(order)
+
+        def scheme(density, bounds):
+            # adaptive Gauss-Kronrod stays on the outer t axis only; the
+            # inner v integral applies the precomputed Gauss rule with
+            # one array-valued density call per QUADPACK sample - the
+            # density itself already runs as native kernels, so the
+            # remaining C<->Python crossings are the ~tens of outer
+            # nodes, not the thousands of inner samples
+            c = bounds.c_const
+            t_buf = np.empty(order)
+
+            def outer(t):
+                d = (bounds.d_const if bounds.d_is_const
+                     else bounds.d_slope * t + bounds.d_intercept)
+                half = 0.5 * (d - c)
+                v = half * nodes + 0.5 * (d + c)
+                t_buf.fill(t)
+                return half * (weights @ density(v, t_buf))
+
+            value, _ = integrate.quad(outer, bounds.a, bounds.b,
+                                      epsabs=kwargs.get("epsabs", 1e-6))
+            return value
+        return scheme
+
+    if method == "MONTE_CARLO":
+        n_samples = kwargs.get("n_samples", 10_000)
+        # one generator for the scheme's lifetime: calls stream from it
+        # instead of rebuilding and re-seeding PCG64 state per region
+        rng = kwargs.get("rng")
+        if rng is None:
+            rng = np.random.default_rng(kwargs.get("random_state"))
+
+        def scheme(density, bounds):
+            t = rng.uniform(bounds.a, bounds.b, n_samples)
+            c = bounds.c_const
+            d = (bounds.d_const if bounds.d_is_const
+                 else bounds.d_slope * t + bounds.d_intercept)
+            v = c + (d - c) * rng.uniform(size=n_samples)
+            values = density(v, t) * (d - c)
+            return (bounds.b - bounds.a) * values.mean()
+        return scheme
+
+    if method == "TENSOR_GAUSS":
+        order = kwargs.get("quad_order", 32)
+        nodes, weights = np.polynomial.legendre.leggauss(order)
+
+        def scheme(density, bounds):
+            a, b = bounds.a, bounds.b
+            t = 0.5 * (b - a) * nodes + 0.5 * (b + a)
+            c = bounds.c_const
+            d = (np.full_like(t, bounds.d_const) if bounds.d_is_const
+                 else bounds.d_slope * t + bounds.d_intercept)
+            half_span = 0.5 * (d - c)
+            v = half_span[:, None] * nodes[None, :] + 0.5 * (d + c)[:, None]
+            # one density call over the whole grid
+            values = density(v.ravel(), np.repeat(t, order)).reshape(order, order)
+            return 0.5 * (b - a) * np.einsum(
+                "i,j,ij->", weights, weights, half_span[:, None] * values)
+        return scheme
+
+    raise ValueError(f"unknown integration method: {method}")
@@ -0,0 +1,518 @@
+# env imports
+import concurrent.futures as futures
+import functools
+import os
+import pathlib
+import sys
+
+import matplotlib
+
+# batch scripts spend measurable time per figure on GUI figure-manager
+# registration; force the headless Agg backend unless the environment
+# (MPLBACKEND) or a running notebook already picked one
+if "MPLBACKEND" not in os.environ and "IPython" not in sys.modules:
+    matplotlib.use("Agg", force=True)
+
+# aggressive path simplification: the CDF / return-period curves are
+# monotone, so collapsing near-collinear vertices is invisible but cuts
+# the segments the Agg rasterizer strokes; chunking keeps peak memory
+# bounded for very long lines
+matplotlib.rcParams.update({
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000,
+})
+
+import matplotlib.collections as mcollections
+import matplotlib.lines as mlines
+import matplotlib.pyplot as plt
+import matplotlib.ticker as mticker
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+# local imports
+from helpers.utils import to_fortran
+
+
+# figures reused across repeated calls of the bootstrap / sensitivity
+# plotters, keyed by plotter name; see _cached_axes
+_FIG_CACHE = {}
+
+# background figure writer: Agg's PNG encode releases the GIL, so the
+# next figure can be built while the previous one is still compressing
+_WRITER = futures.ThreadPoolExecutor(max_workers=2)
+_PENDING = []
+
+
+def _write(fig, save_path, dpi):
+    if pathlib.Path(save_path).suffix.lower() == ".png":
+        # print through an Agg canvas directly, skipping pyplot state
+        # and the extra draw savefig performs on GUI backends
+        original_dpi = fig.dpi
+        fig.dpi = dpi
+        try:
+            FigureCanvasAgg(fig).print_png(
+                save_path, pil_kwargs={"compress_level": 1, "optimize": False})
+        finally:
+            fig.dpi = original_dpi
+    else:
+        fig.savefig(save_path, dpi=dpi)
+
+
+def flush_plots() -> None:
+    """Block until all background figure writes have finished.
+
+    Call once at the end of a batch cell/script before reading the files;
+    re-raises the first failure encountered by a worker.
+    """
+    pending, _PENDING[:] = _PENDING[:], []
+    for future in pending:
+        future.result()
+
+
+def _finalize(fig, save_path, dpi, close=True):
+    """Save `fig` to `save_path` (if given) and close it to bound memory use.
+
+    Figures are only closed when the caller asked for a file on disk; when
+    composing subplots the caller keeps ownership of the figure. Layout is
+    handled by constrained layout at figure creation, so the save avoids
+    the double render that `bbox_inches='tight'` forces. PNG output is
+    encoded at a low zlib compression level: encoding dominates save cost
+    and level 1 trades ~10-15% larger files for a much cheaper write.
+
+    Owned (to-be-closed) figures are handed to a worker thread so encode
+    and disk I/O overlap with building the next figure; `flush_plots()`
+    waits for the queue. Cached figures are written synchronously since
+    the next call may clear and redraw them.
+    """
+    if save_path is not None:
+        if close:
+            future = _WRITER.submit(_write, fig, save_path, dpi)
+            future.add_done_callback(lambda _, fig=fig: plt.close(fig))
+            _PENDING.append(future)
+        else:
+            _write(fig, save_path, dpi)
+
+
+@functools.lru_cache(maxsize=64)
+def _sample_cmap(name: str, n: int, lo: float = 0.0, hi: float = 1.0):
+    """Memoized `(n, 4)` RGBA sample of a named colormap.
+
+    Resolving the colormap and resampling it allocates on every call;
+    sweep loops hit the same `(name, n)` pairs over and over. The cached
+    array is read-only - `.copy()` before mutating colors.
+    """
+    colors = plt.get_cmap(name)(np.linspace(lo, hi, n))
+    colors.flags.writeable = False
+    return colors
+
+
+def _lttb_indices(x, y, n_out: int = 500) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets downsampling, returned as indices.
+
+    Keeps the ~n_out visually significant points of a dense curve so the
+    renderer strokes far fewer segments; returning indices lets callers
+    downsample several aligned series (e.g. a confidence band) with one
+    selection. Series at or below `n_out` points pass through unchanged.
+    """
+    n = len(x)
+    if n <= n_out:
+        return np.arange(n)
+
+    indices = np.empty(n_out, dtype=np.intp)
+    indices[0] = 0
+    indices[-1] = n - 1
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+
+    anchor = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i < n_out - 3:
+            avg_x = x[edges[i + 1]:edges[i + 2]].mean()
+            avg_y = y[edges[i + 1]:edges[i + 2]].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+        area = np.abs((x[anchor] - avg_x) * (y[lo:hi] - y[anchor])
+                      - (x[anchor] - x[lo:hi]) * (avg_y - y[anchor]))
+        anchor = lo + int(area.argmax())
+        indices[i + 1] = anchor
+    return indices
+
+
+def _cached_axes(key, figsize):
+    """Return a reusable `(fig, ax)` pair for plotters called in sweeps.
+
+    Figure/Axes construction (spines, ticks, layout engine) costs tens of
+    milliseconds per call, which dominates tight bootstrap loops. The pair
+    is created once per plotter and cleared on reuse; dropped transparently
+    if the cached figure has been closed in the meantime.
+    """
+    cached = _FIG_CACHE.get(key)
+    if cached is not None and plt.fignum_exists(cached[0].number):
+        fig, ax = cached
+        ax.clear()
+        return fig, ax
+    fig, ax = plt.subplots(layout="constrained", figsize=figsize)
+    _FIG_CACHE[key] = (fig, ax)
+    return fig, ax
+
+
+def plot_event_scatter_with_marginals(events_df: pd.DataFrame, x: str = "duration",
+                                      y: str = "depth", fig=None, save_path=None,
+                                      dpi: int = 150) -> plt.Figure:
+    """Scatter of two event statistics with marginal histograms.
+
+    Arguments
+    ---------
+    events_df : rainfall events table, one row per event
+    x, y : column names to plot against each other
+    fig : optional existing figure to draw into; a new one is created if None
+    save_path : optional path; when given the figure is saved and closed
+    dpi : resolution used when saving
+    """
+    if fig is None:
+        fig = plt.figure(figsize=(7, 7))
+
+    grid = fig.add_gridspec(2, 2, width_ratios=(4, 1), height_ratios=(1, 4),
+                            wspace=0.05, hspace=0.05)
+    ax = fig.add_subplot(grid[1, 0])
+    ax_top = fig.add_subplot(grid[0, 0], sharex=ax)
+    ax_right = fig.add_subplot(grid[1, 1], sharey=ax)
+
+    ax.scatter(events_df[x], events_df[y], s=12, alpha=0.6, edgecolors="none")
+    ax_top.hist(events_df[x], bins=30, color="tab:gray")
+    ax_right.hist(events_df[y], bins=30, color="tab:gray", orientation="horizontal")
+
+    ax_top.tick_params(labelbottom=False)
+    ax_right.tick_params(labelleft=False)
+    ax.set_xlabel(x)
+    ax.set_ylabel(y)
+
+    _finalize(fig, save_path, dpi)
+    return fig
+
+
+def plot_event_statistics_boxplots(events_df: pd.DataFrame,
+                                   columns=("depth", "duration", "intensity"),
+                                   ax=None, save_path=None, dpi: int = 150):
+    """Side-by-side boxplots of the main event statistics."""
+    if ax is None:
+        fig, ax = plt.subplots(layout="constrained", figsize=(6, 4))
+    else:
+        fig = ax.figure
+
+    columns = [c for c in columns if c in events_df.columns]
+    ax.boxplot([events_df[c].dropna() for c in columns], tick_labels=columns)
+    ax.set_ylabel("value")
+
+    _finalize(fig, save_path, dpi)
+    return ax
+
+
+def plot_monthly_event_distribution(events_df: pd.DataFrame, ax=None,
+                                    save_path=None, dpi: int = 150):
+    """Bar chart of event counts per calendar month."""
+    if ax is None:
+        fig, ax = plt.subplots(layout="constrained", figsize=(7, 4))
+    else:
+        fig = ax.figure
+
+    months = pd.DatetimeIndex(events_df["start_time"]).month
+    counts = months.value_counts().reindex(np.arange(1, 13), fill_value=0)
+    ax.bar(counts.index, counts.to_numpy())
+    ax.set_xticks(np.arange(1, 13))
+    ax.set_xlabel("month")
+    ax.set_ylabel("number of events")
+
+    _finalize(fig, save_path, dpi)
+    return ax
+
+
+def plot_inter_event_time_histogram(events_df: pd.DataFrame, bins: int = 40,
+                                    ax=None, save_path=None, dpi: int = 150):
+    """Histogram of dry-spell durations between consecutive events."""
+    if ax is None:
+        fig, ax = plt.subplots(layout="constrained", figsize=(6, 4))
+    else:
+        fig = ax.figure
+
+    iet = events_df["inter_event_time"].dropna()
+    ax.hist(iet, bins=bins)
+    ax.set_xlabel("inter-event time [h]")
+    ax.set_ylabel("count")
+
+    _finalize(fig, save_path, dpi)
+    return ax
+
+
+def plot_pseudo_observations(ranks_df: pd.DataFrame, u_col: str = "u",
+                             v_col: str = "v", ax=None, save_path=None,
+                             dpi: int = 300, return_fig: bool = True):
+    """Scatter of the rank-transformed (pseudo) observations on [0, 1]^2.
+
+    The point cloud is rasterized inside an otherwise vector figure so a
+    PDF/SVG export stays small for thousands of pseudo-observations while
+    axes and labels remain vector.
+    """
+    if save_path is None and not return_fig:
+        return None
+
+    if ax is None:
+        fig, ax = plt.subplots(layout="constrained", figsize=(6, 6))
+    else:
+        fig = ax.figure
+
+    ax.scatter(ranks_df[u_col], ranks_df[v_col], alpha=0.4, s=15,
+               c="steelblue", rasterized=True, zorder=1)
+    ax.set_xlabel("u (rainfall depth rank)")
+    ax.set_ylabel("v (duration rank)")
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+
+    _finalize(fig, save_path, dpi)
+    return ax
+
+
+def plot_copula_aic_comparison(metrics_df: pd.DataFrame, ax=None,
+                               save_path=None, dpi: int = 300, return_fig: bool = True):
+    """Horizontal bar chart ranking the fitted copula families by AIC."""
+    if save_path is None and not return_fig:
+        return None
+
+    if ax is None:
+        fig, ax = plt.subplots(layout="constrained", figsize=(8, 5))
+    else:
+        fig = ax.figure
+
+    # sort once and work on plain arrays; bar labels, the annotation and
+    # barh itself then skip pandas __getitem__/coercion entirely
+    sorted_df = metrics_df.sort_values("AIC", ascending=True)
+    families = sorted_df["Family"].to_numpy()
+    aic = sorted_df["AIC"].to_numpy()
+    colors = _sample_cmap("viridis", len(aic), 0.2, 0.8)
+    bars = ax.barh(families, aic, color=colors)
+    for bar, value in zip(bars, aic):
+        ax.text(bar.get_width(), bar.get_y() + bar.get_height() / 2,
+                f" {value:.1f}", va="center", fontsize=9)
+    ax.annotate("Best Fit", xy=(aic[0], 0), xytext=(aic[0] + 100, 0.5),
+                arrowprops=dict(arrowstyle="->"))
+    ax.set_xlabel("AIC")
+    ax.invert_yaxis()
+
+    _finalize(fig, save_path, dpi)
+    return ax
+
+
+def plot_cdf_comparison(cdf_df: pd.DataFrame, copula_cols, v0_col: str = "v0",
+                        ax=None, save_path=None, dpi: int = 300, return_fig: bool = True):
+    """Overlay the runoff-volume CDF of each copula family."""
+    if save_path is None and not return_fig:
+        return None
+
+    if ax is None:
+        fig, ax = plt.subplots(layout="constrained", figsize=(8, 5))
+    else:
+        fig = ax.figure
+
+    # column-major layout makes each per-copula column slice contiguous;
+    # extracting once also skips pandas dispatch inside the plot loop
+    cdf_df = to_fortran(cdf_df, [v0_col, *copula_cols])
+    v0 = cdf_df[v0_col].to_numpy()
+    curves = cdf_df[list(copula_cols)].to_numpy(copy=False)
+    for i, copula in enumerate(copula_cols):
+        if len(v0) > 1000:
+            keep = _lttb_indices(v0, curves[:, i])
+            ax.plot(v0[keep], curves[keep, i], label=copula, lw=1.5)
+        else:
+            ax.plot(v0, curves[:, i], label=copula, lw=1.5)
+    ax.set_xlabel("runoff volume $v_0$ [mm]")
+    ax.set_ylabel("$F(v_0)$")
+    ax.legend()
+
+    _finalize(fig, save_path, dpi)
+    return ax
+
+
+def plot_return_periods(return_df: pd.DataFrame, copula_cols,
+                        period_col: str = "return_period", ax=None,
+                        save_path=None, dpi: int = 300, return_fig: bool = True):
+    """Runoff volume against return period for each copula family."""
+    if save_path is None and not return_fig:
+        return None
+
+    if ax is None:
+        fig, ax = plt.subplots(layout="constrained", figsize=(8, 5))
+    else:
+        fig = ax.figure
+
+    return_df = to_fortran(return_df, [period_col, *copula_cols])
+    periods = return_df[period_col].to_numpy()
+    volumes = return_df[list(copula_cols)].to_numpy(copy=False)
+
+    # one LineCollection for the connecting lines and one scatter for all
+    # markers: two C-level draws instead of a marker-stroking Line2D per
+    # copula; the legend uses lightweight proxy artists
+    n_copulas = len(copula_cols)
+    colors = plt.get_cmap("tab10")(np.arange(n_copulas) % 10)
+    curves = volumes.T
+    segments = np.stack([np.broadcast_to(periods, curves.shape), curves], axis=-1)
+    ax.add_collection(mcollections.LineCollection(segments, colors=colors))
+    ax.scatter(np.tile(periods, n_copulas), curves.ravel(),
+               color=np.repeat(colors, len(periods), axis=0), s=36)
+    handles = [mlines.Line2D([], [], color=c, marker="o", label=copula)
+               for copula, c in zip(copula_cols, colors)]
+    ax.autoscale_view()
+    ax.set_xscale("log")
+    ax.set_xlabel("return period [years]")
+    ax.set_ylabel("runoff volume [mm]")
+    ax.legend(handles=handles)
+
+    _finalize(fig, save_path, dpi)
+    return ax
+
+
+def plot_return_period_error(return_df: pd.DataFrame, copula_cols,
+                             analytical_col: str = "analytical",
+                             period_col: str = "return_period",
+                             save_path=None, dpi: int = 300, return_fig: bool = True):
+    """Absolute and percentage error of each copula against the analytical
+    closed-form return-period curve, side by side."""
+    if save_path is None and not return_fig:
+        return None
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, sharex=True, layout="constrained",
+                                   figsize=(14, 5))
+
+    # one broadcasted subtract/divide over contiguous memory instead of
+    # two pandas ops (with index alignment) per copula family
+    x = return_df[period_col].to_numpy()
+    estimates = return_df[list(copula_cols)].to_numpy()
+    analytical = return_df[analytical_col].to_numpy()[:, None]
+    abs_error = estimates - analytical
+    pct_error = abs_error / analytical * 100.0
+
+    for i, copula in enumerate(copula_cols):
+        ax1.plot(x, abs_error[:, i], "o-", label=copula)
+        ax2.plot(x, pct_error[:, i], "o-", label=copula)
+    # sharex: scale, tick locations and formatter are configured once on
+    # ax1 and propagate, instead of being recomputed per axes
+    ax1.set_xscale("log")
+    formatter = mticker.ScalarFormatter()
+    ax1.xaxis.set_major_formatter(formatter)
+    ax2.xaxis.set_major_formatter(formatter)
+    ax1.set_xticks([2, 5, 10, 25, 50, 100])
+    for ax in (ax1, ax2):
+        ax.set_xlabel("return period [years]")
+        ax.legend()
+    ax1.set_ylabel("absolute error [mm]")
+    ax2.set_ylabel("error [%]")
+
+    _finalize(fig, save_path, dpi)
+    return fig
+
+
+def plot_bootstrap_confidence_intervals(bootstrap_df: pd.DataFrame,
+                                        v0_col: str = "v0", ax=None,
+                                        save_path=None, dpi: int = 300, return_fig: bool = True):
+    """Bootstrap mean CDF with its confidence band.
+
+    Called once per draw in uncertainty sweeps, so the figure is cached
+    and cleared between calls instead of rebuilt.
+    """
+    if save_path is None and not return_fig:
+        return None
+
+    reused = ax is None
+    if ax is None:
+        fig, ax = _cached_axes("bootstrap", (10, 6))
+    else:
+        fig = ax.figure
+
+    v0 = bootstrap_df[v0_col].to_numpy()
+    mean = bootstrap_df["mean"].to_numpy()
+    lower = bootstrap_df["lower"].to_numpy()
+    upper = bootstrap_df["upper"].to_numpy()
+    if len(v0) > 1000:
+        # downsample band and mean with the mean's indices so they stay aligned
+        keep = _lttb_indices(v0, mean)
+        v0, mean, lower, upper = v0[keep], mean[keep], lower[keep], upper[keep]
+
+    # build the band polygon directly; fill_between would re-parse
+    # arguments, NaN-mask and autoscale on every bootstrap iteration
+    band = np.column_stack([np.r_[v0, v0[::-1]], np.r_[lower, upper[::-1]]])
+    ax.add_collection(mcollections.PolyCollection(
+        [band], alpha=0.3, facecolor="steelblue", label="95% CI"))
+    ax.plot(v0, mean, color="steelblue", lw=2, label="mean")
+    # collections do not autoscale on all matplotlib versions
+    ax.set_xlim(v0.min(), v0.max())
+    ax.set_ylim(min(lower.min(), 0.0), max(upper.max(), 1.0))
+    ax.set_xlabel("runoff volume $v_0$ [mm]")
+    ax.set_ylabel("$F(v_0)$")
+    ax.legend()
+
+    _finalize(fig, save_path, dpi, close=not reused)
+    return ax
+
+
+def plot_parameter_sensitivity(sensitivity_df: pd.DataFrame, param_values,
+                               v0_col: str = "v0", param_name: str = "theta",
+                               ax=None, save_path=None, dpi: int = 300, return_fig: bool = True,
+                               show_legend: bool = False):
+    """CDF curves for a sweep of the copula parameter, colored by value.
+
+    Like the bootstrap plotter this runs inside sweep loops, so both the
+    figure and its colorbar are cached; the colorbar norm is updated in
+    place instead of allocating a new one per call. The colorbar conveys
+    the parameter mapping, so the O(n_params) legend layout work is
+    skipped unless `show_legend` is set.
+    """
+    if save_path is None and not return_fig:
+        return None
+
+    reused = ax is None
+    if ax is None:
+        fig, ax = _cached_axes("sensitivity", (10, 6))
+    else:
+        fig = ax.figure
+
+    # resolve parameter columns once against a plain set - no repeated
+    # pandas Index.__contains__ in the hot path, and `param_{p}` falls
+    # back to a bare str(p) column name
+    colors = _sample_cmap("coolwarm", len(param_values))
+    columns = set(sensitivity_df.columns)
+    present = []
+    for param, color in zip(param_values, colors):
+        col = f"param_{param}" if f"param_{param}" in columns else str(param)
+        if col in columns:
+            present.append((param, col, color))
+    v0 = sensitivity_df[v0_col].to_numpy()
+    curves = sensitivity_df[[col for _, col, _ in present]].to_numpy().T
+
+    # one C-level draw over all curves instead of a Line2D per parameter;
+    # the colorbar carries the parameter mapping, so no per-line legend
+    segments = np.stack([np.broadcast_to(v0, curves.shape), curves], axis=-1)
+    ax.add_collection(mcollections.LineCollection(
+        segments, colors=[c for _, _, c in present], linewidths=1.5))
+    ax.autoscale_view()
+
+    if show_legend:
+        handles = [mlines.Line2D([], [], color=c, lw=1.5,
+                                 label=f"{param_name}={p}")
+                   for p, _, c in present]
+        ax.legend(handles=handles, ncol=2, fontsize=8)
+
+    norm = plt.Normalize(min(param_values), max(param_values))
+    sm = plt.cm.ScalarMappable(cmap="coolwarm", norm=norm)
+    cbar = getattr(fig, "_param_cbar", None)
+    if cbar is None:
+        cbar = fig.colorbar(sm, ax=ax)
+        fig._param_cbar = cbar
+    else:
+        cbar.update_normal(sm)
+    cbar.set_label(param_name)
+    ax.set_xlabel("runoff volume $v_0$ [mm]")
+    ax.set_ylabel("$F(v_0)$")
+
+    _finalize(fig, save_path, dpi, close=not reused)
+    return ax
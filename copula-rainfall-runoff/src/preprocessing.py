@@ -0,0 +1,268 @@
+# env imports
+import functools
+import logging
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional speedup
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+# hydrologically inactive season, excluded from event statistics
+WINTER_MONTHS = (11, 12, 1, 2, 3, 4)
+
+_NS_PER_HOUR = 3_600_000_000_000
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_station_index(db_path: str, table_name: str) -> None:
+    """One-time (per process) index bootstrap on a write connection.
+
+    Kept separate from the query connection so the latter can stay
+    read-only; the brief write lock is taken at most once per database.
+    """
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table_name}_cid "
+                     f"ON {table_name}(climate_id)")
+
+
+def load_data(db_path, climate_id: str,
+              table_name: str = "hourly_rainfall") -> pd.DataFrame:
+    """Hourly rainfall records of one station from the climate database.
+
+    The station column is indexed on first use (`CREATE INDEX IF NOT
+    EXISTS`, on a short-lived write connection), so the per-station
+    lookup is a B-tree probe instead of a full table scan; the query
+    itself runs on a read-only memory-mapped connection tuned for bulk
+    reads (200 MB page cache, in-memory temp store).
+
+    Null, zero and winter-month records are dropped inside the query -
+    rows that `clean_data` would discard never leave SQLite - and the
+    result streams out already ordered by time. Everything is bound via
+    ? placeholders; no value ever lands in the SQL string.
+    """
+    _ensure_station_index(str(db_path), table_name)
+    # queries run on a read-only, memory-mapped connection: the kernel
+    # pages the file in on demand and the mapping is shared between the
+    # parallel station workers through the OS page cache
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        conn.execute("PRAGMA mmap_size=30000000000")
+        conn.execute("PRAGMA query_only=1")
+        conn.execute("PRAGMA cache_size=-200000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        month_slots = ",".join("?" * len(WINTER_MONTHS))
+        query = (
+            f"SELECT * FROM {table_name} "  # nosec - table name is internal
+            "WHERE climate_id = ? AND value IS NOT NULL AND value > 0 "
+            f"AND CAST(strftime('%m', datetime) AS INT) NOT IN ({month_slots}) "
+            "ORDER BY datetime")
+        # stream in bounded chunks instead of materializing one big
+        # list of row tuples; Arrow-backed strings hold the id/flag
+        # columns as dictionary buffers, not per-row Python objects
+        chunks = pd.read_sql_query(
+            query, conn, params=(climate_id, *WINTER_MONTHS),
+            parse_dates=["datetime"],
+            dtype={"climate_id": "string[pyarrow]", "flag": "string[pyarrow]"},
+            chunksize=200_000)
+        data = pd.concat(chunks, ignore_index=True)
+    finally:
+        conn.close()
+
+    # low-cardinality label columns: integer codes over one dictionary
+    # instead of a string per row (categories unify across the chunks)
+    data["climate_id"] = data["climate_id"].astype("category")
+    if "flag" in data.columns:
+        data["flag"] = data["flag"].astype("category")
+
+    logger.info("loaded %d records for station %s", len(data), climate_id)
+    return data
+
+
+def clean_data(data: pd.DataFrame, rain_col: str = "value",
+               time_col: str = "datetime", remove_outliers: bool = False,
+               prefiltered: bool = False,
+               iqr_factor: float = 3.0) -> pd.DataFrame:
+    """Filter a raw rainfall series down to usable wet-season records.
+
+    Drops missing and zero readings and the winter months, then sorts
+    by time. Data arriving from `load_data` already had those filters
+    applied inside SQL - pass `prefiltered=True` to skip repeating them.
+    `remove_outliers` additionally cuts readings above
+    Q3 + `iqr_factor` * IQR (the default keeps only extreme spikes out;
+    1.5 gives the textbook Tukey fence).
+    """
+    # len() is a direct C call; .empty resolves attributes first
+    if not len(data):
+        return data
+
+    # one fused mask, one .iloc copy - the chained filters each copied
+    # the whole frame; the SQL-prefiltered path without outlier removal
+    # never materializes a mask at all
+    rain = data[rain_col].to_numpy(dtype=np.float64)
+    mask = None
+    if not prefiltered:
+        months = data[time_col].dt.month.to_numpy()
+        mask = ~np.isnan(rain) & (rain > 0)
+        mask &= ~np.isin(months, np.array(WINTER_MONTHS, dtype=np.int8))
+    if remove_outliers:
+        # thresholds from the records that survive the filters so far;
+        # both quantiles come out of one partitioning pass. With zero
+        # survivors (dry or bad-sensor station) there is nothing to
+        # derive a fence from - skip the pass instead of crashing
+        survivors = rain if mask is None else rain[mask]
+        if survivors.size:
+            q1, q3 = np.quantile(survivors, [0.25, 0.75])
+            upper_bound = q3 + iqr_factor * (q3 - q1)
+            with np.errstate(invalid="ignore"):
+                outlier_mask = rain <= upper_bound
+            mask = outlier_mask if mask is None else mask & outlier_mask
+
+    if mask is not None and not mask.all():
+        data = data.iloc[mask]
+    # SQL-loaded series arrive ORDER BY datetime; the monotonicity scan
+    # is O(n) with early exit, the sort it avoids is O(n log n)
+    if data[time_col].is_monotonic_increasing:
+        data = data.reset_index(drop=True)
+    else:
+        data = data.sort_values(by=time_col, ignore_index=True)
+    logger.info("cleaned series holds %d records", len(data))
+    return data
+
+
+def _segment_events_scan(t_ns, rain, ietd_ns,
+                         start_idx, end_idx, volume, peak, count):
+    """Single fused scan: boundaries and all per-event aggregates.
+
+    Walks the (time, rain) arrays once, closing an event whenever the
+    gap to the previous record exceeds the IETD, and maintains the
+    running sum/peak/count as it goes - one linear pass instead of a
+    diff, a cumsum and a multi-aggregate groupby. The output arrays are
+    preallocated by the caller at the exact event count, so the scan
+    allocates nothing and no trim copies are made.
+    """
+    n = t_ns.size
+    m = 0
+    cur_start = 0
+    cur_sum = rain[0]
+    cur_peak = rain[0]
+    cur_count = 1
+    for i in range(1, n):
+        if t_ns[i] - t_ns[i - 1] > ietd_ns:
+            start_idx[m] = cur_start
+            end_idx[m] = i - 1
+            volume[m] = cur_sum
+            peak[m] = cur_peak
+            count[m] = cur_count
+            m += 1
+            cur_start = i
+            cur_sum = 0.0
+            cur_peak = 0.0
+            cur_count = 0
+        cur_sum += rain[i]
+        cur_peak = max(cur_peak, rain[i])
+        cur_count += 1
+    start_idx[m] = cur_start
+    end_idx[m] = n - 1
+    volume[m] = cur_sum
+    peak[m] = cur_peak
+    count[m] = cur_count
+
+
+if njit is not None:
+    _segment_events = njit(cache=True)(_segment_events_scan)
+else:
+    _segment_events = None
+
+
+def _segment_events_reduceat(rain, is_new):
+    """Segmentation via C-level reductions, used when numba is absent.
+
+    Event boundaries are contiguous runs once the gap mask is known, so
+    every aggregate is one `reduceat` (or a boundary-index gather) - no
+    groupby hash table, no per-aggregate Python dispatch. `is_new`
+    flags the first record of each event (computed once by the caller).
+    """
+    start_idx = np.flatnonzero(is_new)
+    end_idx = np.append(start_idx[1:] - 1, rain.size - 1)
+    volume = np.add.reduceat(rain, start_idx)
+    peak = np.maximum.reduceat(rain, start_idx)
+    count = np.diff(np.append(start_idx, rain.size))
+    return start_idx, end_idx, volume, peak, count
+
+
+def extract_rainfall_events(data: pd.DataFrame, rain_col: str = "value",
+                            time_col: str = "datetime",
+                            IETD_threshold: float = 6.0) -> pd.DataFrame:
+    """Split an hourly rainfall series into independent events.
+
+    Records closer together than the inter-event time definition (IETD,
+    hours) belong to the same event. Segmentation and the per-event
+    aggregates run in one Numba-compiled scan over the raw int64/float64
+    arrays (`cache=True`, so the kernel compiles once per machine); the
+    groupby route remains as fallback without numba.
+    """
+    if not len(data):
+        return pd.DataFrame()
+
+    # zero-copy int64 view of the timestamps: gap checks, durations and
+    # dry spells are plain integer arithmetic, never Timedelta dispatch
+    times = data[time_col].to_numpy(dtype="datetime64[ns]")
+    t_ns = times.view("int64")
+    rain = data[rain_col].to_numpy(dtype=np.float64)
+    ietd_ns = int(IETD_threshold * _NS_PER_HOUR)
+
+    # gap mask computed once: it sizes the kernel outputs exactly and
+    # drives the reduceat fallback directly
+    is_new = np.empty(t_ns.size, dtype=bool)
+    is_new[0] = True
+    is_new[1:] = (t_ns[1:] - t_ns[:-1]) > ietd_ns
+
+    if _segment_events is not None:
+        n_events = int(np.count_nonzero(is_new))
+        start_idx = np.empty(n_events, np.int64)
+        end_idx = np.empty(n_events, np.int64)
+        volume = np.empty(n_events)
+        peak = np.empty(n_events)
+        count = np.empty(n_events, np.int64)
+        _segment_events(t_ns, rain, ietd_ns,
+                        start_idx, end_idx, volume, peak, count)
+    else:
+        start_idx, end_idx, volume, peak, count = _segment_events_reduceat(
+            rain, is_new)
+
+    start = times[start_idx]
+    end = times[end_idx]
+    start_ns = t_ns[start_idx]
+    end_ns = t_ns[end_idx]
+    events = pd.DataFrame({
+        "Start Time": start,
+        "End Time": end,
+        "Duration (hrs)": (end_ns - start_ns) / _NS_PER_HOUR + 1.0,
+        "Volume (mm)": volume,
+        "Peak Intensity (mm/hr)": peak,
+        "Record Count": count,
+    })
+
+    # dry spell before each event, straight on the int64 arrays - no
+    # temporary frame, no .dt accessor pipelines; gaps spanning the
+    # winter shutdown (different start years) carry no information
+    iet_hrs = np.empty(len(events))
+    iet_hrs[0] = np.nan
+    iet_hrs[1:] = (start_ns[1:] - end_ns[:-1]) / _NS_PER_HOUR
+    start_year = start.astype("datetime64[Y]")
+    end_year = end.astype("datetime64[Y]")
+    iet_hrs[1:][start_year[1:] != end_year[:-1]] = np.nan
+    events["Inter-Event Time (hrs)"] = iet_hrs
+
+    if len(events):
+        logger.info("extracted %d events (IETD = %s h)", len(events),
+                    IETD_threshold)
+    return events
@@ -0,0 +1,81 @@
+# env imports
+import logging
+import os
+import pathlib
+import sys
+
+import joblib
+import numpy as np
+import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - libyaml bindings are optional
+    from yaml import SafeLoader as _YamlLoader
+
+# local imports
+import algorithm_tasks
+import postprocessing
+import preprocessing
+
+logger = logging.getLogger(__name__)
+
+
+def _run_station(station: str, config: dict, save_dir) -> dict:
+    """Full pipeline of one station; runs inside its own worker.
+
+    Load, clean, segment into events, fit the copula families and
+    derive the runoff CDF, then persist the station's datasets.
+    """
+    settings = config["experiment"]
+    data = preprocessing.load_data(settings["db_path"], station)
+    data = preprocessing.clean_data(
+        data, prefiltered=True,
+        remove_outliers=settings.get("remove_outliers", False))
+    events = preprocessing.extract_rainfall_events(
+        data, IETD_threshold=settings.get("IETD_threshold", 6.0))
+
+    events = events.rename(columns={"Volume (mm)": "depth",
+                                    "Duration (hrs)": "duration"})
+    fitted, metrics = algorithm_tasks.fit_copulas(events)
+    v0_vals = np.linspace(settings.get("v0_min", 1.0),
+                          settings.get("v0_max", 100.0),
+                          settings.get("v0_steps", 50))
+    cdf_df = algorithm_tasks.compute_cdf(
+        fitted, v0_vals, settings["physical_params"], n_jobs=1)
+
+    datasets = {
+        f"{station}/events": events,
+        f"{station}/copula_metrics": metrics,
+        f"{station}/cdf": cdf_df,
+    }
+    postprocessing.save_data(save_dir, datasets,
+                             format=settings.get("output_format", "parquet"))
+    return datasets
+
+
+def run(config: dict, save_dir) -> list:
+    """Process every configured station, stations in parallel.
+
+    Station pipelines are fully independent, so they fan out over loky
+    worker processes - SQLite connections cannot be shared across
+    threads, and each worker opens its own read connection. Inner
+    compute_cdf calls stay serial to avoid oversubscription.
+    """
+    stations = config["experiment"]["stations_list"]
+    n_jobs = min(len(stations), os.cpu_count() or 1)
+    return joblib.Parallel(n_jobs=n_jobs, backend="loky")(
+        joblib.delayed(_run_station)(station, config, save_dir)
+        for station in stations)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    config_path = sys.argv[1] if len(sys.argv) > 1 else "config.yaml"
+    with open(config_path) as f:
+        config = yaml.load(f, Loader=_YamlLoader)
+
+    save_dir = pathlib.Path(config["experiment"].get("save_dir", "runs"))
+    metadata = postprocessing.collect_run_metadata(save_dir)
+    postprocessing.save_run_metadata(save_dir, metadata, config)
+    run(config, save_dir)
@@ -0,0 +1,57 @@
+# env imports
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+PHYSICAL_PARAMS = {
+    "h": 0.5,        # impervious fraction [-]
+    "Sdi": 1.5,      # impervious depression storage [mm]
+    "Sil": 5.0,      # pervious depression storage [mm]
+    "fc": 2.0,       # infiltration rate [mm/h]
+    "Sm": 25.0,      # soil storage capacity [mm]
+    "lambda_v": 0.1,  # 1 / mean event volume [1/mm]
+    "lambda_t": 0.2,  # 1 / mean event duration [1/h]
+}
+
+
+@pytest.fixture(scope="session")
+def physical_params():
+    return dict(PHYSICAL_PARAMS)
+
+
+@pytest.fixture(scope="session")
+def events_df():
+    """Synthetic correlated (depth, duration) event sample."""
+    rng = np.random.default_rng(42)
+    n = 300
+    z = rng.multivariate_normal([0.0, 0.0], [[1.0, 0.6], [0.6, 1.0]], size=n)
+    from scipy import stats
+    u = stats.norm.cdf(z)
+    return pd.DataFrame({
+        "depth": stats.expon.ppf(u[:, 0], scale=1.0 / PHYSICAL_PARAMS["lambda_v"]),
+        "duration": stats.expon.ppf(u[:, 1], scale=1.0 / PHYSICAL_PARAMS["lambda_t"]),
+    })
+
+
+@pytest.fixture(scope="session")
+def rainfall_db(tmp_path_factory):
+    """SQLite climate database with two stations of hourly records."""
+    db_path = tmp_path_factory.mktemp("db") / "climate.sqlite"
+    rng = np.random.default_rng(7)
+    frames = []
+    for station in ("6158355", "6158731"):
+        times = pd.date_range("2019-05-01", periods=500, freq="h")
+        values = np.where(rng.uniform(size=times.size) < 0.7, 0.0,
+                          rng.exponential(2.0, times.size).round(1))
+        frames.append(pd.DataFrame({
+            "climate_id": station,
+            "datetime": times.astype(str),
+            "value": values,
+            "flag": "",
+        }))
+    with sqlite3.connect(db_path) as conn:
+        pd.concat(frames).to_sql("hourly_rainfall", conn, index=False)
+    return db_path
@@ -0,0 +1,164 @@
+# env imports
+import numpy as np
+import pytest
+
+# local imports
+import algorithm_tasks as tasks
+
+
+V0_GRID = np.linspace(1.0, 80.0, 9)
+
+
+def test_closed_form_cdf_is_monotone_probability(physical_params):
+    cdf = tasks.runoff_volume_cdf_closed_form(V0_GRID, physical_params)
+
+    assert np.all(cdf >= 0.0) and np.all(cdf <= 1.0)
+    assert np.all(np.diff(cdf) >= 0.0)
+
+
+def test_integration_bounds_regions(physical_params):
+    regions = tasks.get_runoff_integration_bounds(10.0, physical_params)
+
+    assert len(regions) == 2
+    first, second = regions
+    assert first.a == 0.0
+    assert first.b == second.a
+    assert first.c_const == 0.0 and second.c_const == 0.0
+    # upper curve grows while infiltration fills the soil store
+    assert not first.d_is_const and first.d_slope > 0.0
+    # constant plateau beyond the break point, continuous at the break
+    assert second.d_is_const
+    assert second.d_const == pytest.approx(
+        tasks.evaluate_upper_bound(first, np.array([first.b]))[0])
+
+
+def test_integration_bounds_cached(physical_params):
+    tasks._cached_integration_bounds.cache_clear()
+
+    first = tasks.get_runoff_integration_bounds(10.0, physical_params)
+    second = tasks.get_runoff_integration_bounds(10.0, physical_params)
+
+    assert first == second
+    info = tasks._cached_integration_bounds.cache_info()
+    assert info.misses == 1 and info.hits == 1
+    # callers get independent lists over the shared immutable records
+    assert first is not second
+
+
+def test_closed_form_matches_numerical_independence(physical_params):
+    """The copula integral with weak dependence approaches the closed form."""
+    from statsmodels.distributions.copula.api import FrankCopula
+    cdf_df = tasks.compute_cdf({"frank": FrankCopula(1e-4)}, V0_GRID,
+                               physical_params, n_jobs=1, quad_order=48)
+    analytical = tasks.runoff_volume_cdf_closed_form(V0_GRID, physical_params)
+
+    np.testing.assert_allclose(cdf_df["frank"], analytical, atol=0.02)
+
+
+def test_copula_pdf_kernels_match_statsmodels():
+    from statsmodels.distributions.copula.api import (
+        ClaytonCopula, FrankCopula, GumbelCopula)
+    rng = np.random.default_rng(11)
+    u = rng.uniform(0.05, 0.95, 64)
+    v = rng.uniform(0.05, 0.95, 64)
+
+    for copula in (ClaytonCopula(2.0), FrankCopula(3.5), GumbelCopula(1.8)):
+        pdf = tasks._copula_pdf_function(copula)
+        np.testing.assert_allclose(
+            pdf(u, v), copula.pdf(np.column_stack((u, v))), rtol=1e-8)
+
+
+def test_fit_copulas_metrics(events_df):
+    fitted, metrics = tasks.fit_copulas(events_df)
+
+    assert set(fitted) == {"clayton", "frank", "gumbel"}
+    assert len(metrics) == 3
+    assert np.isfinite(metrics["AIC"]).all()
+    # positively correlated sample: positive dependence parameters
+    assert (metrics.loc[metrics["Family"] != "clayton", "theta"] > 0).all()
+
+
+def test_tail_dependence_coefficients():
+    tasks._tail_dependence_coefficients.cache_clear()
+
+    assert tasks._compute_tail_dependence("frank", 5.0) == (0.0, 0.0)
+    assert tasks._compute_tail_dependence("clayton", 2.0) == \
+        pytest.approx((2.0 ** -0.5, 0.0))
+    assert tasks._compute_tail_dependence("gumbel", 2.0) == \
+        pytest.approx((0.0, 2.0 - 2.0 ** 0.5))
+    # repeated (family, theta) pairs resolve from the cache, also for
+    # numpy scalars and float-noise thetas
+    tasks._compute_tail_dependence("clayton", np.float64(2.0 + 1e-14))
+    info = tasks._tail_dependence_coefficients.cache_info()
+    assert info.hits == 1 and info.misses == 3
+    with pytest.raises(ValueError, match="unknown copula family"):
+        tasks._compute_tail_dependence("gaussian-mixture", 1.0)
+
+
+@pytest.mark.parametrize("method, kwargs", [
+    ("TENSOR_GAUSS", {"quad_order": 24}),
+    ("ADAPTIVE_2D_QUADRATURE", {"quad_order": 16, "epsabs": 1e-4}),
+    ("MONTE_CARLO", {"n_samples": 4000, "random_state": 7}),
+    ("SHARED_GRID", {"grid_size": 128}),
+])
+def test_compute_cdf_monotone(events_df, physical_params, method, kwargs):
+    fitted, _ = tasks.fit_copulas(events_df, copula_families=["frank"])
+    cdf_df = tasks.compute_cdf(fitted, V0_GRID, physical_params,
+                               integration_method=method, n_jobs=1, **kwargs)
+
+    values = cdf_df["frank"].to_numpy()
+    assert np.all(values >= 0.0) and np.all(values <= 1.0)
+    tolerance = 0.0 if method == "TENSOR_GAUSS" else 0.05
+    assert np.all(np.diff(values) >= -tolerance)
+
+
+def test_compute_cdf_disk_cache_skips_recompute(events_df, physical_params,
+                                                monkeypatch):
+    fitted, _ = tasks.fit_copulas(events_df, copula_families=["frank"])
+    tasks.compute_cdf.clear_cache()
+
+    calls = []
+    original = tasks._tensor_gauss_cdf_all
+
+    def counting(*args, **kwargs):
+        calls.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(tasks, "_tensor_gauss_cdf_all", counting)
+    first = tasks.compute_cdf(fitted, V0_GRID, physical_params,
+                              use_cache=True, quad_order=12)
+    second = tasks.compute_cdf(fitted, V0_GRID, physical_params,
+                               use_cache=True, quad_order=12)
+
+    assert len(calls) == 1  # second run reads the column from disk
+    import pandas as pd
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_compute_return_period_inverts_cdf():
+    import pandas as pd
+    cdf_df = pd.DataFrame({"v0": np.linspace(0.0, 100.0, 101),
+                           "frank": np.linspace(0.0, 1.0, 101)})
+    result = tasks.compute_return_period(cdf_df, events_per_year=50.0,
+                                         return_periods=(2, 10))
+
+    # F(v0) = v0/100, target = 1 - 1/(50*T)
+    assert result["frank"].iloc[0] == pytest.approx(99.0)
+    assert result["frank"].iloc[1] == pytest.approx(99.8)
+
+
+def test_bootstrap_band_shape(events_df, physical_params):
+    bootstrap_df, band_df = tasks.perform_bootstrap_uncertainty_analysis(
+        events_df.head(80), physical_params, V0_GRID, n_bootstrap=3,
+        copula_families=["frank"], quad_order=12)
+
+    assert len(band_df) == len(V0_GRID)
+    assert (band_df["lower"] <= band_df["upper"]).all()
+    assert bootstrap_df["iteration"].nunique() == 3
+
+
+def test_sensitivity_columns(physical_params):
+    result = tasks.perform_sensitivity_analysis(
+        "frank", [1.0, 3.0], V0_GRID, physical_params, n_jobs=1, quad_order=12)
+
+    assert list(result.columns) == ["v0", "param_1.0", "param_3.0"]
@@ -0,0 +1,90 @@
+# env imports
+import numpy as np
+import pandas as pd
+import pytest
+
+# local imports
+import plotting
+
+
+@pytest.fixture()
+def bootstrap_df():
+    v0 = np.linspace(0.0, 100.0, 2000)
+    mean = 1.0 - np.exp(-0.05 * v0)
+    return pd.DataFrame({"v0": v0, "mean": mean,
+                         "lower": mean - 0.05, "upper": mean + 0.05})
+
+
+def test_lttb_indices_pass_through_below_target():
+    x = np.arange(200.0)
+
+    indices = plotting._lttb_indices(x, np.sin(x), n_out=500)
+
+    np.testing.assert_array_equal(indices, np.arange(200))
+
+
+def test_lttb_indices_downsamples_to_target():
+    x = np.linspace(0.0, 10.0, 5000)
+    y = np.sin(x) + 0.01 * np.cos(40 * x)
+
+    indices = plotting._lttb_indices(x, y, n_out=500)
+
+    assert len(indices) == 500
+    # endpoints survive and the selection stays ordered and duplicate-free
+    assert indices[0] == 0
+    assert indices[-1] == 4999
+    assert (np.diff(indices) > 0).all()
+
+
+def test_save_and_flush_round_trip(tmp_path, events_df):
+    save_path = tmp_path / "scatter.png"
+    plotting.plot_event_scatter_with_marginals(events_df,
+                                               x="duration", y="depth",
+                                               save_path=save_path)
+    plotting.flush_plots()
+
+    assert save_path.exists()
+    assert save_path.stat().st_size > 0
+    assert not plotting._PENDING
+
+
+def test_flush_plots_reraises_worker_failure(tmp_path, events_df,
+                                             monkeypatch):
+    def _boom(fig, save_path, dpi):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(plotting, "_write", _boom)
+    plotting.plot_event_scatter_with_marginals(events_df,
+                                               x="duration", y="depth",
+                                               save_path=tmp_path / "x.png")
+
+    with pytest.raises(OSError, match="disk full"):
+        plotting.flush_plots()
+    # the failed future is drained; later flushes start clean
+    assert not plotting._PENDING
+
+
+def test_bootstrap_plotter_reuses_cached_figure(tmp_path, bootstrap_df):
+    first = plotting.plot_bootstrap_confidence_intervals(
+        bootstrap_df, save_path=tmp_path / "boot_0.png")
+    second = plotting.plot_bootstrap_confidence_intervals(
+        bootstrap_df, save_path=tmp_path / "boot_1.png")
+
+    # sweep calls redraw into one cached figure instead of rebuilding it
+    assert second.figure is first.figure
+    assert (tmp_path / "boot_0.png").exists()
+    assert (tmp_path / "boot_1.png").exists()
+
+
+def test_sensitivity_plotter_reuses_figure_and_colorbar():
+    param_values = [1.0, 2.0, 3.0]
+    v0 = np.linspace(0.0, 50.0, 100)
+    sweep = pd.DataFrame({"v0": v0, **{f"param_{p}": 1.0 - np.exp(-p * v0 / 50)
+                                       for p in param_values}})
+
+    first = plotting.plot_parameter_sensitivity(sweep, param_values)
+    cbar = first.figure._param_cbar
+    second = plotting.plot_parameter_sensitivity(sweep, param_values)
+
+    assert second.figure is first.figure
+    assert second.figure._param_cbar is cbar
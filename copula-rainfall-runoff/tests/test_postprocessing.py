@@ -0,0 +1,97 @@
+# env imports
+import numpy as np
+import pandas as pd
+import pytest
+
+# local imports
+import postprocessing
+
+try:
+    from pyarrow import csv as pa_csv
+
+    def _read_csv(path):
+        # pyarrow's threaded parser keeps the round-trip checks fast
+        return pa_csv.read_csv(path).to_pandas()
+except ImportError:  # pragma: no cover - fall back to the pandas parser
+    _read_csv = pd.read_csv
+
+
+@pytest.fixture()
+def datasets():
+    return {
+        "events/6158355": pd.DataFrame({"depth": [1.0, 2.5],
+                                        "duration": [3.0, 7.0]}),
+        "cdf": pd.DataFrame({"v0": np.linspace(0.0, 10.0, 5),
+                             "frank": np.linspace(0.0, 1.0, 5)}),
+    }
+
+
+@pytest.mark.parametrize("format, reader", [
+    ("parquet", pd.read_parquet),
+    ("feather", pd.read_feather),
+    ("csv", _read_csv),
+])
+def test_save_data_round_trip(tmp_path, datasets, format, reader):
+    paths = postprocessing.save_data(tmp_path, datasets, format=format)
+
+    assert len(paths) == len(datasets)
+    for path in paths:
+        assert path.suffix == f".{format}"
+    loaded = reader(paths[0])
+    pd.testing.assert_frame_equal(loaded, datasets["events/6158355"])
+
+
+def test_save_data_inside_running_event_loop(tmp_path, datasets):
+    # callers embedded in async pipelines hit the thread-pool fallback
+    import asyncio
+
+    async def caller():
+        return postprocessing.save_data(tmp_path, datasets)
+
+    paths = asyncio.run(caller())
+
+    assert len(paths) == len(datasets)
+    assert all(path.exists() for path in paths)
+
+
+def test_save_data_skips_none_and_keeps_empty(tmp_path, datasets):
+    datasets["missing"] = None
+    datasets["empty"] = pd.DataFrame({"v0": []})
+
+    paths = postprocessing.save_data(tmp_path, datasets)
+
+    names = {path.stem for path in paths}
+    assert "missing" not in names
+    assert "empty" in names
+
+
+def test_save_data_unknown_format(tmp_path, datasets):
+    with pytest.raises(ValueError, match="unknown format"):
+        postprocessing.save_data(tmp_path, datasets, format="hdf5")
+
+
+def test_collect_run_metadata_fields(tmp_path):
+    run_dir = tmp_path / "2019-06-01 -- exp42"
+    metadata = postprocessing.collect_run_metadata(run_dir)
+
+    assert metadata["experiment_id"] == "exp42"
+    assert {"git_revision", "platform", "user", "hostname"} <= set(metadata)
+    # environment lookups are resolved once per process
+    assert postprocessing._env_fingerprint() is postprocessing._env_fingerprint()
+
+
+def test_save_run_metadata_writes_yaml(tmp_path):
+    run_dir = tmp_path / "2019-06-01 -- exp42"
+    metadata = postprocessing.collect_run_metadata(run_dir)
+    postprocessing.save_run_metadata(run_dir, metadata,
+                                     experiment_parameters={"IETD": 6})
+
+    assert (run_dir / "00_run_metadata.yaml").exists()
+    assert (run_dir / "00_experiment_parameters.yaml").exists()
+    # machine-readable JSON siblings carry the same payloads
+    import json
+    loaded = json.loads((run_dir / "00_run_metadata.json").read_bytes())
+    assert loaded["experiment_id"] == "exp42"
+    params = json.loads(
+        (run_dir / "00_experiment_parameters.json").read_bytes())
+    assert params == {"IETD": 6}
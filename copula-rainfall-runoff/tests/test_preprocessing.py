@@ -0,0 +1,128 @@
+# env imports
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# local imports
+import preprocessing
+
+
+def test_load_data_single_station(rainfall_db):
+    data = preprocessing.load_data(rainfall_db, "6158355")
+
+    assert (data["climate_id"] == "6158355").all()
+    assert len(data) > 0
+    assert pd.api.types.is_datetime64_any_dtype(data["datetime"])
+    # filtering and ordering happen inside the query
+    assert (data["value"] > 0).all()
+    assert data["datetime"].is_monotonic_increasing
+
+
+def test_extract_rainfall_events_segments_on_ietd():
+    times = pd.to_datetime([
+        "2019-06-01 00:00", "2019-06-01 01:00", "2019-06-01 02:00",
+        # 10 h dry gap > IETD of 6 h starts a new event
+        "2019-06-01 12:00", "2019-06-01 13:00",
+    ])
+    data = pd.DataFrame({"datetime": times,
+                         "value": [1.0, 2.0, 3.0, 4.0, 5.0]})
+    events = preprocessing.extract_rainfall_events(data, IETD_threshold=6.0)
+
+    assert len(events) == 2
+    assert list(events["Volume (mm)"]) == [6.0, 9.0]
+    assert list(events["Peak Intensity (mm/hr)"]) == [3.0, 5.0]
+    assert list(events["Duration (hrs)"]) == [3.0, 2.0]
+    assert np.isnan(events["Inter-Event Time (hrs)"].iloc[0])
+    assert events["Inter-Event Time (hrs)"].iloc[1] == 10.0
+
+
+def test_inter_event_time_resets_across_years():
+    times = pd.to_datetime([
+        "2018-10-30 00:00", "2018-10-30 01:00",
+        # the gap to the next event spans the winter shutdown
+        "2019-05-02 00:00", "2019-05-02 01:00",
+        # 20 h dry gap within the same season
+        "2019-05-02 21:00",
+    ])
+    data = pd.DataFrame({"datetime": times, "value": np.ones(5)})
+    events = preprocessing.extract_rainfall_events(data, IETD_threshold=6.0)
+
+    iet = events["Inter-Event Time (hrs)"]
+    assert len(events) == 3
+    assert np.isnan(iet.iloc[0])
+    assert np.isnan(iet.iloc[1])  # cross-year gap carries no information
+    assert iet.iloc[2] == 20.0
+
+
+def test_clean_data_removes_outliers():
+    times = pd.date_range("2019-06-01", periods=50, freq="h")
+    values = np.full(50, 2.0)
+    values[10] = 500.0  # far beyond Q3 + 3 IQR
+    data = pd.DataFrame({"datetime": times, "value": values})
+
+    cleaned = preprocessing.clean_data(data, remove_outliers=True)
+
+    assert len(cleaned) == 49
+    assert cleaned["value"].max() == 2.0
+
+
+def test_clean_data_outliers_with_no_survivors():
+    # a dry or bad-sensor station: every record is zero, missing or
+    # winter, so the outlier fence has nothing to be derived from
+    data = pd.DataFrame({
+        "datetime": pd.to_datetime(["2019-06-01 00:00", "2019-06-01 01:00",
+                                    "2019-12-24 00:00"]),
+        "value": [0.0, np.nan, 3.0],
+    })
+    cleaned = preprocessing.clean_data(data, remove_outliers=True)
+
+    assert len(cleaned) == 0
+
+
+def test_segmentation_fallback_matches_kernel():
+    rng = np.random.default_rng(3)
+    t_ns = (np.cumsum(rng.integers(1, 20, 200))
+            * 3_600_000_000_000).astype(np.int64)
+    rain = rng.exponential(2.0, 200)
+    ietd_ns = 6 * 3_600_000_000_000
+
+    is_new = np.empty(t_ns.size, dtype=bool)
+    is_new[0] = True
+    is_new[1:] = (t_ns[1:] - t_ns[:-1]) > ietd_ns
+    fallback = preprocessing._segment_events_reduceat(rain, is_new)
+    if preprocessing._segment_events is not None:
+        n_events = len(fallback[0])
+        kernel = (np.empty(n_events, np.int64), np.empty(n_events, np.int64),
+                  np.empty(n_events), np.empty(n_events),
+                  np.empty(n_events, np.int64))
+        preprocessing._segment_events(t_ns, rain, ietd_ns, *kernel)
+    else:
+        kernel = fallback
+
+    for a, b in zip(fallback, kernel):
+        np.testing.assert_allclose(a, b)
+
+
+def test_clean_data_filters_and_sorts():
+    data = pd.DataFrame({
+        "datetime": pd.to_datetime(["2019-06-02 01:00", "2019-06-01 00:00",
+                                    "2019-12-24 00:00", "2019-06-01 05:00",
+                                    "2019-06-01 06:00"]),
+        "value": [1.2, 0.0, 3.0, np.nan, 2.0],
+    })
+    cleaned = preprocessing.clean_data(data)
+
+    # zero, missing and winter rows are gone, remainder is time-ordered
+    assert list(cleaned["value"]) == [2.0, 1.2]
+    assert cleaned["datetime"].is_monotonic_increasing
+
+
+def test_load_data_creates_station_index(rainfall_db):
+    preprocessing.load_data(rainfall_db, "6158355")
+
+    with sqlite3.connect(rainfall_db) as conn:
+        indexes = [row[1] for row in
+                   conn.execute("PRAGMA index_list(hourly_rainfall)")]
+    assert "idx_hourly_rainfall_cid" in indexes
@@ -0,0 +1,31 @@
+# env imports
+import pytest
+
+# local imports
+import workflow
+
+
+@pytest.fixture()
+def config(rainfall_db, physical_params):
+    return {
+        "experiment": {
+            "db_path": str(rainfall_db),
+            "stations_list": ["6158355", "6158731"],
+            "IETD_threshold": 6.0,
+            "physical_params": physical_params,
+            "v0_steps": 10,
+        },
+    }
+
+
+def test_run_processes_all_stations(tmp_path, config):
+    results = workflow.run(config, tmp_path)
+
+    assert len(results) == 2
+    for station, datasets in zip(config["experiment"]["stations_list"],
+                                 results):
+        assert set(datasets) == {f"{station}/events",
+                                 f"{station}/copula_metrics",
+                                 f"{station}/cdf"}
+        assert (tmp_path / station / "cdf.parquet").exists()
+        assert len(datasets[f"{station}/events"]) > 0
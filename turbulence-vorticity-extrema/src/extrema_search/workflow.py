@@ -0,0 +1,101 @@
+# env imports
+import logging
+import pathlib
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - libyaml bindings are optional
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import neptune
+except ImportError:  # pragma: no cover - tracking is an optional extra
+    neptune = None
+
+# local imports
+from extrema_search import algorithm_tasks
+
+logger = logging.getLogger(__name__)
+
+
+def _load_yaml(path) -> dict:
+    with open(path) as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def load_parameters(paths) -> list:
+    """Parsed contents of several YAML parameter files, in order.
+
+    The files are independent and each load blocks on disk before the
+    C-backed parse, so they run together on a small thread pool instead
+    of back to back.
+    """
+    paths = list(paths)
+    if len(paths) <= 1:
+        return [_load_yaml(path) for path in paths]
+    with ThreadPoolExecutor(min(len(paths), 3)) as pool:
+        return list(pool.map(_load_yaml, paths))
+
+
+def init_tracking(project: str, parameters: dict):
+    """Tracking-run handle, or None when neptune is not installed."""
+    if neptune is None:
+        logger.warning("neptune is not installed; run tracking disabled")
+        return None
+    run = neptune.init_run(project=project)
+    run["parameters"] = parameters
+    return run
+
+
+def _save_extrema(save_dir, extrema: dict) -> list:
+    """Persist each snapshot's extrema as .npy pairs; returns the paths."""
+    save_dir = pathlib.Path(save_dir)
+    save_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for key, (minima, maxima) in extrema.items():
+        stem = pathlib.PurePath(key).stem
+        for kind, points in (("minima", minima), ("maxima", maxima)):
+            path = save_dir / f"{stem}_{kind}.npy"
+            np.save(path, points)
+            paths.append(path)
+    return paths
+
+
+def run(snapshots: dict, axis: np.ndarray, parameters: dict,
+        save_dir=None, reference_run=None, tracking_run=None) -> dict:
+    """Extrema search over one batch of spectral snapshots.
+
+    The tracking-service transfers are pure I/O and independent of the
+    stencil work, so they overlap with it on a thread pool: the
+    reference-run download starts before the vorticity inversion and
+    the result upload is submitted as soon as the arrays are on disk,
+    with both joined only at the end instead of each blocking the
+    pipeline for seconds.
+    """
+    with ThreadPoolExecutor(2) as pool:
+        download = None
+        if reference_run is not None and save_dir is not None:
+            download = pool.submit(reference_run["data/arrays"].download,
+                                   str(save_dir))
+
+        fields = algorithm_tasks.compute_vorticity(snapshots)
+        grids = algorithm_tasks.create_grid(fields, axis)
+        extrema = algorithm_tasks.find_extrema(
+            grids, threshold=parameters.get("threshold", 0.0))
+
+        upload = None
+        if save_dir is not None:
+            paths = _save_extrema(save_dir, extrema)
+            if tracking_run is not None:
+                upload = pool.submit(tracking_run["data/arrays"].upload_files,
+                                     [str(path) for path in paths])
+
+        for future in (download, upload):
+            if future is not None:
+                future.result()
+    logger.info("ran extrema search over %d snapshots", len(snapshots))
+    return extrema
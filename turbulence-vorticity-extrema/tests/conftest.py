@@ -0,0 +1,25 @@
+# env imports
+import numpy as np
+import pytest
+
+N = 64
+
+
+@pytest.fixture(scope="session")
+def axis():
+    return np.linspace(0.0, 2.0 * np.pi, N, endpoint=False)
+
+
+@pytest.fixture(scope="session")
+def vorticity_field(axis):
+    """Smooth doubly periodic field with well-separated extrema."""
+    X, Y = np.meshgrid(axis, axis, indexing="xy")
+    return np.cos(3.0 * X) * np.cos(2.0 * Y)
+
+
+@pytest.fixture(scope="session")
+def snapshots(vorticity_field):
+    """Spectral snapshots keyed like the solver output files."""
+    w_k = np.fft.fft2(vorticity_field)
+    return {f"w_k_{iteration:07d}.npy": w_k * scale
+            for iteration, scale in ((0, 1.0), (100, 0.8), (2500, 0.5))}
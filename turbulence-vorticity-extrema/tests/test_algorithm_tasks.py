@@ -0,0 +1,128 @@
+# env imports
+import numpy as np
+
+# local imports
+from extrema_search import algorithm_tasks as tasks
+from extrema_search.helpers import _kernels
+
+
+def test_extrema_kernel_matches_stacked_fallback(axis, vorticity_field):
+    z = tasks._create_grid(axis, axis, vorticity_field)["z"]
+    expected_min, expected_max = tasks._neighbor_extrema_masks(z)
+
+    if _kernels.find_extrema_kernel is None:
+        kernel = _kernels._find_extrema_kernel_python
+    else:
+        kernel = _kernels.find_extrema_kernel
+    is_min = np.empty((z.shape[0] - 2, z.shape[1] - 2), dtype=np.bool_)
+    is_max = np.empty_like(is_min)
+    kernel(z, is_min, is_max)
+
+    np.testing.assert_array_equal(is_min, expected_min)
+    np.testing.assert_array_equal(is_max, expected_max)
+
+
+def test_compute_vorticity_empty_batch():
+    assert tasks.compute_vorticity({}) == {}
+
+
+def test_compute_vorticity_inverts_spectral_snapshots(snapshots,
+                                                      vorticity_field):
+    fields = tasks.compute_vorticity(snapshots)
+
+    assert list(fields) == list(snapshots)
+    np.testing.assert_allclose(fields["w_k_0000000.npy"], vorticity_field,
+                               atol=1e-12)
+    np.testing.assert_allclose(fields["w_k_0002500.npy"],
+                               0.5 * vorticity_field, atol=1e-12)
+
+
+def test_create_grid_is_structure_of_arrays(axis, vorticity_field):
+    grid = tasks._create_grid(axis, axis, vorticity_field)
+
+    assert set(grid) == {"x", "y", "z", "boundary"}
+    assert grid["z"].shape == vorticity_field.shape
+    assert grid["x"].shape == grid["z"].shape
+    assert grid["z"].dtype == np.float64
+    assert grid["z"].flags["C_CONTIGUOUS"]
+    # boundary mask flags exactly the outer frame
+    assert grid["boundary"][0].all() and grid["boundary"][-1].all()
+    assert grid["boundary"][:, 0].all() and grid["boundary"][:, -1].all()
+    assert not grid["boundary"][1:-1, 1:-1].any()
+
+
+def test_iteration_labels(snapshots):
+    labels = tasks.iteration_labels(snapshots)
+
+    assert labels == ["Iteration = 0", "Iteration = 100",
+                      "Iteration = 2500"]
+
+
+def test_neighborhood_is_a_view(axis, vorticity_field):
+    grid = tasks._create_grid(axis, axis, vorticity_field)
+    window = tasks.neighborhood(grid["z"], 5, 7)
+
+    assert window.shape == (3, 3)
+    assert window.base is grid["z"]
+    np.testing.assert_allclose(window, grid["z"][4:7, 6:9])
+
+
+def _brute_force_extrema(z):
+    minima, maxima = set(), set()
+    for i in range(1, z.shape[0] - 1):
+        for j in range(1, z.shape[1] - 1):
+            neighbors = np.delete(z[i - 1:i + 2, j - 1:j + 2].ravel(), 4)
+            if z[i, j] < neighbors.min():
+                minima.add((i, j))
+            if z[i, j] > neighbors.max():
+                maxima.add((i, j))
+    return minima, maxima
+
+
+def test_find_extrema_matches_brute_force(axis, vorticity_field):
+    grid = tasks._create_grid(axis, axis, vorticity_field)
+    minima, maxima = tasks._find_extrema(grid)
+    expected_min, expected_max = _brute_force_extrema(grid["z"])
+
+    assert len(minima) == len(expected_min)
+    assert len(maxima) == len(expected_max)
+    assert np.isclose(maxima[:, 2].max(), 1.0, atol=0.05)
+    assert np.isclose(minima[:, 2].min(), -1.0, atol=0.05)
+    found = {(float(x), float(y)) for x, y, _ in maxima}
+    expected = {(float(grid["x"][i, j]), float(grid["y"][i, j]))
+                for i, j in expected_max}
+    assert found == expected
+
+
+def test_find_extrema_threshold_filters_weak_points(axis, vorticity_field):
+    grid = tasks._create_grid(axis, axis, vorticity_field)
+    minima, maxima = tasks._find_extrema(grid, threshold=0.5)
+
+    assert (np.abs(minima[:, 2]) >= 0.5).all()
+    assert (np.abs(maxima[:, 2]) >= 0.5).all()
+
+
+def test_find_extrema_empty_batch():
+    assert tasks.find_extrema({}) == {}
+
+
+def test_find_extrema_parallel_matches_serial(axis, vorticity_field):
+    snapshots = {f"w_k_{i:07d}.npy": scale * vorticity_field
+                 for i, scale in ((0, 1.0), (100, 0.8), (2500, 0.5))}
+    grids = tasks.create_grid(snapshots, axis)
+
+    serial = tasks.find_extrema(grids, threshold=0.2, n_jobs=1)
+    parallel = tasks.find_extrema(grids, threshold=0.2, n_jobs=2)
+
+    assert list(serial) == list(parallel)
+    for key in serial:
+        np.testing.assert_allclose(serial[key][0], parallel[key][0])
+        np.testing.assert_allclose(serial[key][1], parallel[key][1])
+
+
+def test_create_grid_per_snapshot(axis, vorticity_field):
+    snapshots = {"a": vorticity_field, "b": 2.0 * vorticity_field}
+    grids = tasks.create_grid(snapshots, axis)
+
+    assert set(grids) == {"a", "b"}
+    np.testing.assert_allclose(grids["b"]["z"], 2.0 * grids["a"]["z"])
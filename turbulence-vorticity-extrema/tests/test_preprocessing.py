@@ -0,0 +1,45 @@
+# env imports
+import numpy as np
+
+# local imports
+from extrema_search import preprocessing
+
+
+def test_extend_default_matches_full_tile(vorticity_field):
+    extended = preprocessing.extend(vorticity_field)
+
+    np.testing.assert_array_equal(extended,
+                                  np.tile(vorticity_field, (3, 3)))
+
+
+def test_extend_small_halo_wraps_periodically(vorticity_field):
+    extended = preprocessing.extend(vorticity_field, halo=1)
+
+    height, width = vorticity_field.shape
+    assert extended.shape == (height + 2, width + 2)
+    np.testing.assert_array_equal(extended[1:-1, 1:-1], vorticity_field)
+    np.testing.assert_array_equal(extended[0, 1:-1], vorticity_field[-1])
+    np.testing.assert_array_equal(extended[1:-1, 0], vorticity_field[:, -1])
+
+
+def test_get_subdomain_matches_linear_scan(axis):
+    x_limit, y_limit = (1.0, 4.0), (0.5, 5.5)
+
+    ix0, ix1, iy0, iy1 = preprocessing.get_subdomain(axis, x_limit, y_limit)
+
+    assert ix0 == np.flatnonzero(axis > x_limit[0])[0]
+    assert ix1 == np.flatnonzero(axis > x_limit[1])[0]
+    assert iy0 == np.flatnonzero(axis > y_limit[0])[0]
+    assert iy1 == np.flatnonzero(axis > y_limit[1])[0]
+    window = axis[ix0:ix1]
+    assert (window > x_limit[0]).all() and (window <= x_limit[1]).all()
+
+
+def test_wrap_window_crosses_the_boundary(vorticity_field):
+    window = preprocessing.wrap_window(vorticity_field, 0, 0)
+
+    assert window.shape == (3, 3)
+    assert window[0, 0] == vorticity_field[-1, -1]
+    assert window[1, 1] == vorticity_field[0, 0]
+    np.testing.assert_array_equal(
+        window, preprocessing.extend(vorticity_field, halo=1)[0:3, 0:3])
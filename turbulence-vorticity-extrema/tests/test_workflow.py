@@ -0,0 +1,72 @@
+# env imports
+import numpy as np
+import yaml
+
+# local imports
+from extrema_search import workflow
+
+
+class _StubRun:
+    """Duck-typed tracking run recording the field accesses it serves."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __getitem__(self, field):
+        return _StubField(self.calls, field)
+
+
+class _StubField:
+    def __init__(self, calls, field):
+        self._calls = calls
+        self._field = field
+
+    def download(self, destination):
+        self._calls.append(("download", self._field, destination))
+
+    def upload_files(self, paths):
+        self._calls.append(("upload", self._field, list(paths)))
+
+
+def test_load_parameters_preserves_order(tmp_path):
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"parameters_{index}.yaml"
+        path.write_text(yaml.safe_dump({"index": index}))
+        paths.append(path)
+
+    loaded = workflow.load_parameters(paths)
+
+    assert loaded == [{"index": 0}, {"index": 1}, {"index": 2}]
+
+
+def test_init_tracking_without_neptune(monkeypatch):
+    monkeypatch.setattr(workflow, "neptune", None)
+
+    assert workflow.init_tracking("project/extrema", {}) is None
+
+
+def test_run_overlaps_tracking_io(tmp_path, snapshots, axis):
+    reference_run = _StubRun()
+    tracking_run = _StubRun()
+
+    extrema = workflow.run(snapshots, axis, {"threshold": 0.2},
+                           save_dir=tmp_path, reference_run=reference_run,
+                           tracking_run=tracking_run)
+
+    assert list(extrema) == list(snapshots)
+    assert reference_run.calls == [("download", "data/arrays",
+                                    str(tmp_path))]
+    (kind, field, uploaded), = tracking_run.calls
+    assert (kind, field) == ("upload", "data/arrays")
+    assert len(uploaded) == 2 * len(snapshots)
+    saved = np.load(tmp_path / "w_k_0000000_maxima.npy")
+    np.testing.assert_allclose(saved, extrema["w_k_0000000.npy"][1])
+
+
+def test_run_without_tracking(tmp_path, snapshots, axis):
+    extrema = workflow.run(snapshots, axis, {}, save_dir=tmp_path)
+
+    assert all((tmp_path / f"w_k_{i:07d}_minima.npy").exists()
+               for i in (0, 100, 2500))
+    assert list(extrema) == list(snapshots)
@@ -0,0 +1,3 @@
+from optimization.network import build_network_data
+from optimization.model import build_model, solve_model
+from optimization.postprocessing import extract_solution, save_inp_file, save_results
@@ -0,0 +1,74 @@
+# env imports
+import pyomo.environ as pyo
+
+
+# head gain contributed by a running pump [m] and unit energy price used by
+# the linearized objective; both are placeholders for pattern-driven values
+PUMP_HEAD_GAIN = 30.0
+ENERGY_PRICE = 1.0
+MAX_FLOW = 1e3
+
+
+def build_model(network_data: dict, num_timesteps: int = 24) -> pyo.ConcreteModel:
+    """Build the linearized pump-scheduling model.
+
+    Flows are signed along each link's nominal direction; junction heads
+    are bounded below by elevation so feasible solutions carry
+    non-negative pressures.
+    """
+    junctions = network_data["junctions"]
+    reservoirs = network_data["reservoirs"]
+    links = {**network_data["pipes"], **network_data["pumps"]}
+
+    m = pyo.ConcreteModel()
+    m.Nodes = pyo.Set(initialize=list(junctions) + list(reservoirs))
+    m.Junctions = pyo.Set(initialize=list(junctions))
+    m.Links = pyo.Set(initialize=list(links))
+    m.Pumps = pyo.Set(initialize=list(network_data["pumps"]))
+    m.T = pyo.RangeSet(0, num_timesteps - 1)
+
+    m.q = pyo.Var(m.Links, m.T, bounds=(-MAX_FLOW, MAX_FLOW))
+    m.h = pyo.Var(m.Nodes, m.T)
+    m.pump_on = pyo.Var(m.Pumps, m.T, domain=pyo.Binary)
+
+    # fixed-head boundary nodes
+    for name, data in reservoirs.items():
+        for t in m.T:
+            m.h[name, t].fix(data["head"])
+
+    def _min_head(m, n, t):
+        return m.h[n, t] >= junctions[n]["elevation"]
+    m.min_head = pyo.Constraint(m.Junctions, m.T, rule=_min_head)
+
+    def _mass_balance(m, n, t):
+        inflow = sum(m.q[l, t] for l, d in links.items() if d["end"] == n)
+        outflow = sum(m.q[l, t] for l, d in links.items() if d["start"] == n)
+        return inflow - outflow == junctions[n]["demand"]
+    m.mass_balance = pyo.Constraint(m.Junctions, m.T, rule=_mass_balance)
+
+    # pumps only move water while running, and only forward
+    def _pump_capacity(m, p, t):
+        return m.q[p, t] <= MAX_FLOW * m.pump_on[p, t]
+    m.pump_capacity = pyo.Constraint(m.Pumps, m.T, rule=_pump_capacity)
+
+    def _pump_direction(m, p, t):
+        return m.q[p, t] >= 0
+    m.pump_direction = pyo.Constraint(m.Pumps, m.T, rule=_pump_direction)
+
+    m.objective = pyo.Objective(
+        expr=sum(ENERGY_PRICE * PUMP_HEAD_GAIN * m.q[p, t]
+                 for p in m.Pumps for t in m.T)
+        + sum(m.h[n, t] for n in m.Junctions for t in m.T),
+        sense=pyo.minimize,
+    )
+    return m
+
+
+def solve_model(model: pyo.ConcreteModel, solver: str = "glpk"):
+    """Solve the model in place and return the Pyomo results object."""
+    opt = pyo.SolverFactory(solver)
+    results = opt.solve(model)
+    if results.solver.termination_condition != pyo.TerminationCondition.optimal:
+        raise RuntimeError(
+            f"solver finished with {results.solver.termination_condition}")
+    return results
@@ -0,0 +1,65 @@
+# env imports
+import pathlib
+
+
+def _parse_sections(text: str) -> dict:
+    """Split INP text into `{section name: [tokenized rows]}`."""
+    sections = {}
+    current = None
+    for raw in text.splitlines():
+        line = raw.split(";", 1)[0].strip()
+        if not line:
+            continue
+        if line.startswith("[") and line.endswith("]"):
+            current = line[1:-1].upper()
+            sections[current] = []
+            continue
+        if current is not None:
+            sections[current].append(line.split())
+    return sections
+
+
+def build_network_data(inp_path: str) -> dict:
+    """Read an EPANET INP file into the plain dictionaries the model uses.
+
+    Returns a dict with keys `junctions`, `reservoirs`, `pipes`, `pumps`.
+    Junction demands are taken as constant base demands; patterns are not
+    expanded here.
+    """
+    text = pathlib.Path(inp_path).read_text()
+    sections = _parse_sections(text)
+
+    junctions = {}
+    for row in sections.get("JUNCTIONS", []):
+        junctions[row[0]] = {
+            "elevation": float(row[1]),
+            "demand": float(row[2]) if len(row) > 2 else 0.0,
+        }
+
+    reservoirs = {}
+    for row in sections.get("RESERVOIRS", []):
+        reservoirs[row[0]] = {"head": float(row[1])}
+
+    pipes = {}
+    for row in sections.get("PIPES", []):
+        pipes[row[0]] = {
+            "start": row[1],
+            "end": row[2],
+            "length": float(row[3]),
+            "diameter": float(row[4]),
+            "roughness": float(row[5]) if len(row) > 5 else 100.0,
+        }
+
+    pumps = {}
+    for row in sections.get("PUMPS", []):
+        pumps[row[0]] = {"start": row[1], "end": row[2]}
+
+    if not junctions and not reservoirs:
+        raise ValueError(f"no nodes found in INP file: {inp_path}")
+
+    return {
+        "junctions": junctions,
+        "reservoirs": reservoirs,
+        "pipes": pipes,
+        "pumps": pumps,
+    }
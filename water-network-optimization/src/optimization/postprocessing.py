@@ -0,0 +1,69 @@
+# env imports
+import os
+import pathlib
+import shutil
+
+import pandas as pd
+import pyomo.environ as pyo
+
+
+def extract_solution(model: pyo.ConcreteModel) -> dict:
+    """Pull the solved variable values into plain record lists.
+
+    Returns `{'flows': [...], 'heads': [...], 'pump_status': [...]}` where
+    each entry is a list of per-(element, timestep) dicts ready for
+    `pd.DataFrame`.
+    """
+    flows = [
+        {"link": l, "timestep": t, "flow": pyo.value(model.q[l, t])}
+        for l in model.Links for t in model.T
+    ]
+    heads = [
+        {"node": n, "timestep": t, "head": pyo.value(model.h[n, t])}
+        for n in model.Nodes for t in model.T
+    ]
+    pump_status = [
+        {"pump": p, "timestep": t, "on": round(pyo.value(model.pump_on[p, t]))}
+        for p in model.Pumps for t in model.T
+    ]
+    return {"flows": flows, "heads": heads, "pump_status": pump_status}
+
+
+def save_inp_file(run_dir, inp_path: str, copy: bool = False) -> pathlib.Path:
+    """Archive the input INP file alongside the run results.
+
+    Hardlinks instead of copying when the run directory lives on the same
+    filesystem, which is O(1) regardless of file size; pass `copy=True`
+    (or hit a cross-device/permission `OSError`) to fall back to a real
+    byte copy.
+    """
+    run_dir = pathlib.Path(run_dir)
+    run_dir.mkdir(parents=True, exist_ok=True)
+    destination = run_dir / pathlib.Path(inp_path).name
+    if copy:
+        shutil.copyfile(inp_path, destination)
+    else:
+        try:
+            os.link(inp_path, destination)
+        except OSError:
+            shutil.copyfile(inp_path, destination)
+    return destination
+
+
+def save_results(run_dir, results: dict, format: str = "feather") -> None:
+    """Write each record list in `results` to `<run_dir>/<name>.<format>`.
+
+    Feather is the default: serializing numeric records is several times
+    faster than CSV and roughly half the size on disk. Pass
+    `format='csv'` when human-inspectable output matters more.
+    """
+    if format not in ("feather", "csv"):
+        raise ValueError(f"unsupported results format: {format}")
+    run_dir = pathlib.Path(run_dir)
+    run_dir.mkdir(parents=True, exist_ok=True)
+    for name, records in results.items():
+        frame = pd.DataFrame(records)
+        if format == "feather":
+            frame.to_feather(run_dir / f"{name}.feather")
+        else:
+            frame.to_csv(run_dir / f"{name}.csv", index=False)
@@ -0,0 +1,59 @@
+# env imports
+import pytest
+import pyomo.environ as pyo
+
+# local imports
+from optimization.network import build_network_data
+from optimization.model import build_model
+
+
+SIMPLE_INP = """\
+[RESERVOIRS]
+R1  100.0
+
+[JUNCTIONS]
+J1  50.0  10.0
+J2  45.0  5.0
+
+[PIPES]
+L1  J1  J2  1000.0  300.0  100.0
+
+[PUMPS]
+P1  R1  J1  HEAD curve1
+
+[END]
+"""
+
+
+@pytest.fixture
+def save_dir(tmp_path):
+    return tmp_path / "run"
+
+
+@pytest.fixture(scope="session")
+def inp_file(tmp_path_factory):
+    path = tmp_path_factory.mktemp("network") / "network.inp"
+    path.write_text(SIMPLE_INP)
+    return path
+
+
+@pytest.fixture(scope="session")
+def mock_model(inp_file):
+    """Unsolved model with all variables initialized to fixed values.
+
+    Extraction only reads `.value`, so initializing is enough to exercise
+    postprocessing without a solver. Session-scoped because consumers only
+    read from it; a test that needs to mutate should `.clone()` locally.
+    """
+    network_data = build_network_data(str(inp_file))
+    model = build_model(network_data, num_timesteps=4)
+    for var in model.component_data_objects(pyo.Var):
+        if not var.fixed:
+            var.set_value(1.0 if var.domain is pyo.Binary else 10.0)
+    return model
+
+
+@pytest.fixture(scope="session")
+def glpk_available():
+    if not pyo.SolverFactory("glpk").available(exception_flag=False):
+        pytest.skip("GLPK solver not available")
@@ -0,0 +1,140 @@
+# env imports
+import dataclasses
+import typing
+
+import pytest
+
+# local imports
+from optimization.network import build_network_data
+from optimization.model import build_model, solve_model
+from optimization.postprocessing import extract_solution, save_results
+
+
+CASE1_INP = """\
+[RESERVOIRS]
+R1  100.0
+
+[JUNCTIONS]
+J1  50.0  10.0
+
+[PUMPS]
+P1  R1  J1  HEAD curve1
+
+[END]
+"""
+
+CASE2_INP = """\
+[RESERVOIRS]
+R1  100.0
+
+[JUNCTIONS]
+J1  50.0  10.0
+J2  45.0  5.0
+
+[PIPES]
+L1  J1  J2  1000.0  300.0  100.0
+
+[PUMPS]
+P1  R1  J1  HEAD curve1
+
+[END]
+"""
+
+CASE3_INP = """\
+[RESERVOIRS]
+R1  120.0
+
+[JUNCTIONS]
+J1  60.0  8.0
+J2  55.0  4.0
+J3  52.0  6.0
+
+[PIPES]
+L1  J1  J2  800.0  250.0  110.0
+L2  J1  J3  900.0  200.0  110.0
+
+[PUMPS]
+P1  R1  J1  HEAD curve1
+
+[END]
+"""
+
+CASE4_INP = """\
+[RESERVOIRS]
+R1  120.0
+
+[JUNCTIONS]
+J1  60.0  8.0
+J2  55.0  4.0
+J3  52.0  6.0
+
+[PIPES]
+L1  J1  J2  800.0  250.0  110.0
+L2  J2  J3  600.0  200.0  110.0
+L3  J1  J3  900.0  200.0  110.0
+
+[PUMPS]
+P1  R1  J1  HEAD curve1
+
+[END]
+"""
+
+
+def run_scenario_on_optimization_and_simulation(inp_text, save_dir, tmp_path,
+                                                num_timesteps=24, solver="glpk"):
+    """Write the INP, run the optimization pipeline and archive the results."""
+    inp_path = tmp_path / "case.inp"
+    inp_path.write_text(inp_text)
+    network_data = build_network_data(str(inp_path))
+    model = build_model(network_data, num_timesteps=num_timesteps)
+    solve_model(model, solver=solver)
+    results = extract_solution(model)
+    save_results(save_dir, results)
+    return network_data, results
+
+
+def check_no_negative_pressures(network_data, results):
+    elevations = {n: d["elevation"] for n, d in network_data["junctions"].items()}
+    for rec in results["heads"]:
+        if rec["node"] in elevations:
+            assert rec["head"] >= elevations[rec["node"]] - 1e-6
+
+
+def check_mass_balance(network_data, results):
+    links = {**network_data["pipes"], **network_data["pumps"]}
+    demands = {n: d["demand"] for n, d in network_data["junctions"].items()}
+    timesteps = {rec["timestep"] for rec in results["flows"]}
+    for t in timesteps:
+        flow = {rec["link"]: rec["flow"] for rec in results["flows"]
+                if rec["timestep"] == t}
+        for node, demand in demands.items():
+            inflow = sum(q for l, q in flow.items() if links[l]["end"] == node)
+            outflow = sum(q for l, q in flow.items() if links[l]["start"] == node)
+            assert inflow - outflow == pytest.approx(demand, abs=1e-6)
+
+
+@dataclasses.dataclass
+class HydraulicCase:
+    id: str
+    inp: str
+    num_timesteps: int = 24
+    solver: str = "glpk"
+    assertions: typing.List[typing.Callable] = dataclasses.field(
+        default_factory=lambda: [check_no_negative_pressures, check_mass_balance])
+
+
+CASES = [
+    HydraulicCase("pump_only", CASE1_INP),
+    HydraulicCase("pump_and_pipe", CASE2_INP),
+    HydraulicCase("branched", CASE3_INP),
+    HydraulicCase("looped", CASE4_INP),
+]
+
+
+@pytest.mark.parametrize("case", CASES, ids=lambda c: c.id)
+def test_hydraulic_feasibility(case, save_dir, tmp_path, glpk_available):
+    network_data, results = run_scenario_on_optimization_and_simulation(
+        case.inp, save_dir, tmp_path,
+        num_timesteps=case.num_timesteps, solver=case.solver)
+    for check in case.assertions:
+        check(network_data, results)
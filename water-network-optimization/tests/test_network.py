@@ -0,0 +1,58 @@
+# env imports
+import pytest
+
+# local imports
+from optimization.network import build_network_data
+
+
+LOOPED_INP = """\
+[RESERVOIRS]
+R1  120.0
+
+[JUNCTIONS]
+J1  60.0  8.0
+J2  55.0  4.0
+J3  52.0  6.0
+
+[PIPES]
+L1  J1  J2  800.0  250.0  110.0
+L2  J2  J3  600.0  200.0  110.0
+L3  J1  J3  900.0  200.0  110.0
+
+[PUMPS]
+P1  R1  J1  HEAD curve1
+
+[END]
+"""
+
+
+@pytest.mark.skip(reason="placeholder - unimplemented mock scenario")
+def test_build_network_data():
+    ...
+
+
+@pytest.mark.parametrize("inp_text, n_junctions, n_pipes", [
+    pytest.param(None, 2, 1, id="simple"),
+    pytest.param(LOOPED_INP, 3, 3, id="looped"),
+])
+def test_build_network_data_success(inp_text, n_junctions, n_pipes, inp_file, tmp_path):
+    if inp_text is not None:
+        inp_file = tmp_path / "looped.inp"
+        inp_file.write_text(inp_text)
+
+    data = build_network_data(str(inp_file))
+
+    assert len(data["junctions"]) == n_junctions
+    assert len(data["pipes"]) == n_pipes
+    assert len(data["reservoirs"]) == 1
+    assert len(data["pumps"]) == 1
+    for pipe in data["pipes"].values():
+        assert pipe["length"] > 0
+        assert pipe["diameter"] > 0
+
+
+def test_build_network_data_empty_file(tmp_path):
+    path = tmp_path / "empty.inp"
+    path.write_text("[END]\n")
+    with pytest.raises(ValueError, match="no nodes"):
+        build_network_data(str(path))